@@ -0,0 +1,162 @@
+/* Client-side callbacks for Modular Chemistry.
+––––––––––––––––––––––––––––––––––––––––––––––––––
+Served automatically from the assets folder and called by the
+app.clientside_callback registrations in app.py.
+*/
+
+(function () {
+    'use strict';
+
+    var LABELS = {
+        organic: 'Organic Compound',
+        ionic: 'Ionic Compound',
+        oxide: 'Oxide Compound',
+        hydro: 'Hydroxide Compound'
+    };
+
+    /* The formula engine. hill() matches formula.hill, which keys the
+     * dictionary; the data the rest needs (element orders, ions and
+     * dictionary aliases) comes from formula.rules() via the formula-rules
+     * store, so there is a single source for it (see tests/test_formula.py).
+     */
+    function formatCounts(counts, order) {
+        var rank = {};
+        for (var i = 0; i < order.length; i++) {
+            rank[order[i]] = i;
+        }
+        var symbols = Object.keys(counts).filter(function (s) {
+            return counts[s] > 0;
+        });
+        symbols.sort(function (a, b) {
+            var ra = a in rank ? rank[a] : order.length;
+            var rb = b in rank ? rank[b] : order.length;
+            if (ra !== rb) {
+                return ra - rb;
+            }
+            return a < b ? -1 : (a > b ? 1 : 0);
+        });
+        return symbols.map(function (s) {
+            return counts[s] === 1 ? s : s + counts[s];
+        }).join('');
+    }
+
+    function hill(counts) {
+        return formatCounts(counts, counts.C > 0 ? ['C', 'H'] : []);
+    }
+
+    function ordered(counts, compound, rules) {
+        return formatCounts(counts, rules.orders[compound] || rules.orders.organic);
+    }
+
+    function grouped(counts, compound, rules) {
+        for (var i = 0; i < rules.ions.length; i++) {
+            var ion = rules.ions[i][0];
+            var group = rules.ions[i][1];
+            var times = null;
+            var rest = {};
+            var s;
+            for (s in group) {
+                var n = counts[s] || 0;
+                var multiple = n % group[s] === 0 ? n / group[s] : 0;
+                times = times === null || times === multiple ? multiple : 0;
+            }
+            for (s in counts) {
+                if (!(s in group) && counts[s] > 0) {
+                    rest[s] = counts[s];
+                }
+            }
+            if (!times || !Object.keys(rest).length) {
+                continue;
+            }
+            var part = times === 1 ? ion : '(' + ion + ')' + times;
+            return rules.ions[i][2] ? part + ordered(rest, compound, rules) : ordered(rest, compound, rules) + part;
+        }
+        return null;
+    }
+
+    function canonical(counts, compound, rules) {
+        var selected = {};
+        for (var s in counts) {
+            if (counts[s] > 0) {
+                selected[s] = counts[s];
+            }
+        }
+        if (!Object.keys(selected).length) {
+            return '';
+        }
+        var key = hill(selected);
+        if (key in rules.aliases) {
+            return rules.aliases[key];
+        }
+        var group = compound === 'organic' ? null : grouped(selected, compound, rules);
+        return group || ordered(selected, compound, rules);
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        chemistry: {
+            /* The compound structure button pressed last. */
+            structure: function (organic, ionic, oxide, hydro) {
+                var stamps = {organic: organic, ionic: ionic, oxide: oxide, hydro: hydro};
+                var compound = 'organic';
+                for (var key in stamps) {
+                    if (Number(stamps[key] || 0) > Number(stamps[compound] || 0)) {
+                        compound = key;
+                    }
+                }
+                return JSON.stringify(compound);
+            },
+
+            label: function (structure) {
+                return LABELS[JSON.parse(structure)] || LABELS.hydro;
+            },
+
+            /* JSON-encoded formula for the selection, [''] when it is empty. */
+            formula: function (structure, selection, rules) {
+                var text = canonical(selection || {}, JSON.parse(structure), rules);
+                return JSON.stringify(text === '' ? [''] : text);
+            },
+
+            textbox: function (intermediate) {
+                var text = JSON.parse(intermediate);
+                return typeof text === 'string' ? text : '';
+            },
+
+            /* Keep the selection as an element -> count map.
+             *
+             * Arguments are the Reset button's n_clicks, the n_clicks of every
+             * element button, then (as State) the button ids with the ids of
+             * repeated copies mapped to their element (K1 -> K), the current
+             * selection and the n_clicks seen last time. Only the buttons whose
+             * count went up are applied, so the selection never has to be rebuilt
+             * from every counter, and Reset just empties it.
+             */
+            select: function () {
+                var args = Array.prototype.slice.call(arguments);
+                var seen = args.pop() || {};
+                var selection = args.pop() || {};
+                var buttons = args.pop() || {ids: [], duplicates: {}};
+                var reset = args.shift() || 0;
+                var keep = reset <= (seen.reset || 0);
+                var counts = {};
+                var clicks = {reset: reset};
+
+                if (keep) {
+                    for (var key in selection) {
+                        counts[key] = selection[key];
+                    }
+                }
+                for (var i = 0; i < buttons.ids.length; i++) {
+                    var id = buttons.ids[i];
+                    var symbol = buttons.duplicates[id] || id;
+                    var n = args[i] || 0;
+                    var added = n - (seen[id] || 0);
+                    clicks[id] = n;
+                    if (added > 0 && keep) {
+                        counts[symbol] = (counts[symbol] || 0) + added;
+                    }
+                }
+                return [counts, clicks];
+            }
+        }
+    });
+})();
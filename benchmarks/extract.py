@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Compare ways of turning one dictionary table into rows.
+
+    python benchmarks/extract.py [saved Dictionary_of_chemical_formulas.html]
+
+Without a saved page a synthetic one is generated with a table about the
+size of the two 'C' tables. Reports time per table and peak Python-heap memory
+(tracemalloc; libxml2's own allocations are not included) for:
+
+  roundtrip  BeautifulSoup + pd.read_html + to_json/read_json (the old path)
+  read_html  BeautifulSoup + pd.read_html
+  lean       incremental lxml parse + <tr>/<td> walk (extract.tables)
+
+The first two need BeautifulSoup and pandas, which the app itself no
+longer uses (``pip install -r benchmarks/requirements.txt``).
+"""
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+from bs4 import BeautifulSoup  # noqa: E402
+
+import extract  # noqa: E402
+
+ROWS = 1500
+
+
+def synthetic_page(rows=ROWS):
+    body = ''.join(
+        '<tr><td>C{0}H{1}O</td><td><a href="./Compound_{0}_{1}.html">Compound {0} {1}</a></td>'
+        '<td>{0}-{1}-0</td></tr>'.format(n, n * 2 + 2) for n in range(rows))
+    filler = '<p>' + 'Lorem ipsum dolor sit amet. ' * 2000 + '</p>'
+    return '<html><body>{0}<table id="mwB1w"><tbody>{1}</tbody></table>{0}</body></html>'.format(filler, body)
+
+
+def roundtrip(html, tid):
+    table = BeautifulSoup(html, 'lxml').find_all(attrs={'id': tid})[0]
+    df = pd.read_html(io.StringIO(str(table)))[0]
+    return pd.read_json(io.StringIO(df.to_json(orient='split')), orient='split')
+
+
+def read_html(html, tid):
+    table = BeautifulSoup(html, 'lxml').find_all(attrs={'id': tid})[0]
+    return pd.read_html(io.StringIO(str(table)))[0]
+
+
+def lean(html, tid):
+    return extract.tables(html, [tid])[tid]
+
+
+def measure(fn, html, tid, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(html, tid)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fn(html, tid)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(timings), peak
+
+
+def main(argv):
+    if argv:
+        with open(argv[0], 'rb') as fh:
+            html = fh.read().decode('utf-8')
+        tid = 'mwB1w'
+    else:
+        html, tid = synthetic_page(), 'mwB1w'
+    print('page {:.1f} kB, table {}'.format(len(html) / 1024.0, tid))
+    for fn in (roundtrip, read_html, lean):
+        seconds, peak = measure(fn, html, tid)
+        print('{:<10} {:8.1f} ms   peak {:8.1f} kB'.format(fn.__name__, seconds * 1000, peak / 1024.0))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
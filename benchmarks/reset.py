@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Callback graph size and Reset cost of the app.
+
+Run from the repository root:
+
+    python benchmarks/reset.py
+
+Every server-side callback that listens to the Reset button is dispatched the
+way the browser would (one POST to _dash-update-component each) through
+Flask's test client, so the numbers cover server-side cost only, not network
+round trips. Client-side callbacks never reach the server and are only counted.
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+
+def reset_callbacks(callback_map):
+    for output, spec in sorted(callback_map.items()):
+        if any(i['id'] == 'reset' for i in spec['inputs']):
+            yield output, spec
+
+
+def main(repeat=20):
+    client = app.server.test_client()
+    dependencies = client.get('/_dash-dependencies').data
+    listeners = list(reset_callbacks(app.app.callback_map))
+    callbacks = [(output, spec) for output, spec in listeners if not spec.get('clientside_function')]
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for output, spec in callbacks:
+            inputs = [dict(i, value=1 if i['id'] == 'reset' else None) for i in spec['inputs']]
+            body = {'output': output, 'inputs': inputs, 'state': [], 'changedPropIds': ['reset.n_clicks']}
+            response = client.post('/_dash-update-component', data=json.dumps(body),
+                                   content_type='application/json')
+            assert response.status_code == 200, response.status_code
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    print('callbacks registered    {}'.format(len(app.app.callback_map)))
+    print('_dash-dependencies      {} bytes'.format(len(dependencies)))
+    print('requests per Reset      {} ({} handled in the browser)'.format(
+        len(callbacks), len(listeners) - len(callbacks)))
+    print('Reset, server time      {:.2f} ms median, {:.2f} ms max'.format(
+        timings[len(timings) // 2] * 1000, timings[-1] * 1000))
+
+
+if __name__ == '__main__':
+    main()
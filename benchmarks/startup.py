@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Import time and memory of ``app:server``, what each gunicorn worker starts with.
+
+Run from the repository root:
+
+    python benchmarks/startup.py [--repeat 5] [--no-warmup] [--max-seconds S] [--max-rss MB]
+
+Each run imports the app in a fresh interpreter (with ``-X importtime``) and
+reports the wall time of the import, resident memory afterwards, the imports
+of app.py that took longest and whether any of ``LAZY`` got loaded. Exits
+non-zero if a limit is exceeded or a lazy module was imported at startup, so
+it can gate a deploy.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only needed on the first upstream fetch or article render, if ever.
+LAZY = ('numpy', 'pandas', 'bs4', 'html5lib', 'lxml')
+
+PROBE = '''
+import json, os, sys, time
+started = time.perf_counter()
+from app import server
+seconds = time.perf_counter() - started
+with open('/proc/self/statm') as f:
+    rss = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+print(json.dumps({
+    'seconds': seconds,
+    'rss': rss,
+    'loaded': sorted(name for name in %r if name in sys.modules),
+}))
+''' % (LAZY,)
+
+
+def importtimes(stderr, parent='app'):
+    """Cumulative microseconds of each module ``parent`` imports itself, from ``-X importtime``."""
+    found = {}
+    children = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        try:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            cumulative = int(cumulative)
+        except ValueError:
+            continue
+        # Nested imports are indented two spaces a level and listed before
+        # the module that imported them.
+        name = name[1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        if depth == 1:
+            children[name.strip()] = cumulative
+        elif depth == 0:
+            if name.strip() == parent:
+                found = children
+            children = {}
+    return found
+
+
+def probe(warmup=True):
+    env = dict(os.environ, WARMUP='1' if warmup else '0')
+    done = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROBE], cwd=ROOT, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    result = json.loads(done.stdout.strip().splitlines()[-1])
+    result['imports'] = importtimes(done.stderr)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--no-warmup', action='store_true', help='import with WARMUP=0')
+    parser.add_argument('--top', type=int, default=10, help='slowest imports to list')
+    parser.add_argument('--max-seconds', type=float, help='fail if the median import takes longer')
+    parser.add_argument('--max-rss', type=float, help='fail if the median RSS is above this many MB')
+    args = parser.parse_args(argv)
+
+    runs = [probe(warmup=not args.no_warmup) for _ in range(args.repeat)]
+    seconds = sorted(run['seconds'] for run in runs)[len(runs) // 2]
+    rss = sorted(run['rss'] for run in runs)[len(runs) // 2] / 1024.0 / 1024
+    loaded = sorted(set(name for run in runs for name in run['loaded']))
+    imports = runs[-1]['imports']
+
+    print('import app:server       {:.3f} s median of {}'.format(seconds, len(runs)))
+    print('RSS after import        {:.1f} MB'.format(rss))
+    print('lazy modules loaded     {}'.format(', '.join(loaded) or 'none'))
+    print('slowest imports of app (cumulative, last run):')
+    for name, micros in sorted(imports.items(), key=lambda item: -item[1])[:args.top]:
+        print('  {:<24} {:>8.1f} ms'.format(name, micros / 1000.0))
+
+    failed = []
+    if args.max_seconds is not None and seconds > args.max_seconds:
+        failed.append('import took {:.3f} s, limit {} s'.format(seconds, args.max_seconds))
+    if args.max_rss is not None and rss > args.max_rss:
+        failed.append('RSS {:.1f} MB, limit {} MB'.format(rss, args.max_rss))
+    if loaded:
+        failed.append('imported at startup: {}'.format(', '.join(loaded)))
+    for message in failed:
+        print('FAIL ' + message)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Bytes on the wire for one page load and one Search.
+
+Run from the repository root:
+
+    python benchmarks/wire.py
+
+Every request the browser makes for the page - index, scripts, styles,
+layout, dependency graph - plus the Search callbacks is sent through Flask's
+test client, once without Accept-Encoding and once the way a current browser
+asks, and the body sizes are added up. A reload is sent with the validators
+of the first response, so cached assets show up as 0 bytes. Upstream fetches
+are whatever the Search for ``FORMULA`` needs, made once before measuring.
+"""
+import json
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+import jobs  # noqa: E402
+import lookup  # noqa: E402
+
+BROWSER = 'gzip, deflate, br'
+
+FORMULA = 'H2O'
+
+RESOURCE = re.compile(r'(?:href|src)="(/[^"]+)"')
+
+
+def page_requests(client):
+    index = client.get('/').data.decode('utf-8')
+    requests = [('GET', '/', None)]
+    requests += [('GET', path.replace('&amp;', '&'), None) for path in RESOURCE.findall(index)]
+    requests += [('GET', '/_dash-layout', None), ('GET', '/_dash-dependencies', None)]
+    return requests
+
+
+def search_requests(chem):
+    request = {'formula': chem, 'at': 0, 'job': chem}
+    search = {
+        'output': 'search-request.data',
+        'inputs': [{'id': 'search', 'property': 'n_clicks', 'value': 1}],
+        'state': [{'id': 'intermediate-value', 'property': 'children', 'value': json.dumps(chem)},
+                  {'id': 'search-request', 'property': 'data', 'value': None}],
+        'changedPropIds': ['search.n_clicks']}
+    results = {
+        'output': '..textbox-2.value...article.src...search-poll.disabled..',
+        'inputs': [{'id': 'search-request', 'property': 'data', 'value': request},
+                   {'id': 'search-poll', 'property': 'n_intervals', 'value': 1}],
+        'state': [],
+        'changedPropIds': ['search-poll.n_intervals']}
+    return [('POST', '/_dash-update-component', search),
+            ('POST', '/_dash-update-component#results', results),
+            ('GET', app.article_url(chem), None)]
+
+
+def finish_search(chem):
+    # The result callback only answers once the Search job is done.
+    jobs.start(chem, lookup.search, chem)
+    jobs.result(chem).result()
+
+
+def send(client, method, path, body, headers):
+    if path.endswith('#results'):
+        finish_search(FORMULA)
+    if method == 'POST':
+        return client.post(path.split('#')[0], data=json.dumps(body), content_type='application/json',
+                           headers=headers)
+    return client.get(path, headers=headers)
+
+
+def load(client, requests, encoding, revalidate=False):
+    sizes = {}
+    for method, path, body in requests:
+        headers = {'Accept-Encoding': encoding} if encoding else {}
+        response = send(client, method, path, body, headers)
+        if revalidate and method == 'GET':
+            cache_control = response.headers.get('Cache-Control', '')
+            if 'immutable' in cache_control:
+                # A fingerprinted URL: the browser does not ask again.
+                sizes[path] = (0, 'cached')
+                continue
+            validators = {}
+            if response.headers.get('ETag'):
+                validators['If-None-Match'] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+            response = send(client, method, path, body, dict(headers, **validators))
+        sizes[path] = (len(response.get_data()), response.headers.get('Content-Encoding') or response.status_code)
+    return sizes
+
+
+def main():
+    client = app.server.test_client()
+    requests = page_requests(client) + search_requests(FORMULA)
+    runs = [('plain', load(client, requests, None)),
+            ('compressed', load(client, requests, BROWSER)),
+            ('reload', load(client, requests, BROWSER, revalidate=True))]
+    width = min(60, max(len(path) for _, path, _ in requests))
+    for method, path, _ in requests:
+        print('{:<{}}  {}'.format(path[:width], width, '  '.join(
+            '{:>9} {:<8}'.format(sizes[path][0], sizes[path][1]) for _, sizes in runs)))
+    print('{:<{}}  {}'.format('total', width, '  '.join(
+        '{:>9} {:<8}'.format(sum(size for size, _ in sizes.values()), name) for name, sizes in runs)))
+
+
+if __name__ == '__main__':
+    main()
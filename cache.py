@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""Caches for data fetched from upstream sources."""
+import collections
+import contextlib
+import fcntl
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+import metrics
+
+
+class LRUCache(object):
+    """Thread-safe LRU cache bounded by an approximate byte budget.
+
+    Entries expire ``ttl`` seconds after they were stored, so the next get()
+    misses and the caller refreshes them; get_stale() still returns them,
+    for callers that serve the old value while they refresh it. Hits,
+    misses, stale hits, expiries and evictions are counted in metrics as
+    ``cache.<name>.*``.
+    """
+
+    def __init__(self, name, max_bytes, ttl, clock=time.monotonic):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.nbytes = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+
+    def _count(self, event):
+        metrics.incr('cache.{}.{}'.format(self.name, event))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= self._clock():
+                del self._entries[key]
+                self.nbytes -= entry[1]
+                self._count('expired')
+                entry = None
+            if entry is None:
+                self._count('misses')
+                return None
+            self._entries.move_to_end(key)
+            self._count('hits')
+            return entry[0]
+
+    def get_stale(self, key):
+        """``(value, expired)``, keeping expired entries; ``(None, False)`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._count('misses')
+                return None, False
+            self._entries.move_to_end(key)
+            expired = entry[2] <= self._clock()
+            self._count('stale' if expired else 'hits')
+            return entry[0], expired
+
+    def put(self, key, value, size):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size, self._clock() + self.ttl)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self._count('evictions')
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+class DiskCache(object):
+    """Compressed blobs on disk, shared by every worker on the host.
+
+    Each value is gzipped into its own file named after a hash of the key;
+    ``index.json`` maps keys to those files, their sizes and any ``meta``
+    stored with them (e.g. the validators of an upstream response). Reads
+    touch the blob so its mtime orders entries for LRU eviction once the
+    total size goes over ``max_bytes``. Blobs older than ``ttl`` seconds are
+    reported as expired by get_stale() but kept until replaced or evicted.
+    Writes and evictions hold an exclusive lock on ``index.lock`` and replace
+    files atomically, so workers never see a half-written blob or index.
+    Hits, misses, stale hits, writes and evictions are counted in metrics as
+    ``cache.<name>.*``.
+    """
+
+    INDEX = 'index.json'
+
+    def __init__(self, name, directory, max_bytes, ttl=None, clock=time.time):
+        self.name = name
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+
+    def _count(self, event):
+        metrics.incr('cache.{}.{}'.format(self.name, event))
+
+    def _path(self, filename):
+        return os.path.join(self.directory, filename)
+
+    def _filename(self, key):
+        return hashlib.sha1(key.encode('utf-8')).hexdigest() + '.gz'
+
+    @contextlib.contextmanager
+    def _locked(self):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+        with open(self._path('index.lock'), 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read_index(self):
+        try:
+            with open(self._path(self.INDEX), encoding='utf-8') as fh:
+                return json.load(fh)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _write_index(self, entries):
+        tmp = self._path(self.INDEX + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            json.dump(entries, fh, separators=(',', ':'))
+        os.replace(tmp, self._path(self.INDEX))
+
+    def _read(self, key):
+        path = self._path(self._filename(key))
+        try:
+            with gzip.GzipFile(path, 'rb') as fh:
+                value = fh.read().decode('utf-8')
+                stored = fh.mtime
+            os.utime(path)
+        except (IOError, OSError, EOFError):
+            return None, None
+        return value, stored
+
+    def get(self, key):
+        value, _ = self._read(key)
+        self._count('misses' if value is None else 'hits')
+        return value
+
+    def get_stale(self, key):
+        """``(value, expired)``; ``(None, False)`` on a miss."""
+        value, stored = self._read(key)
+        if value is None:
+            self._count('misses')
+            return None, False
+        expired = self.ttl is not None and (stored or 0) + self.ttl <= self._clock()
+        self._count('stale' if expired else 'hits')
+        return value, expired
+
+    def meta(self, key):
+        """The ``meta`` stored with ``key`` by put(), or None."""
+        entry = self._read_index().get(key)
+        return entry[2] if entry and len(entry) > 2 else None
+
+    def put(self, key, value, meta=None):
+        filename = self._filename(key)
+        # The gzip header's mtime records when the value was stored.
+        blob = gzip.compress(value.encode('utf-8'), mtime=int(self._clock()))
+        if len(blob) > self.max_bytes:
+            return
+        with self._locked():
+            tmp = self._path(filename + '.tmp')
+            with open(tmp, 'wb') as fh:
+                fh.write(blob)
+            os.replace(tmp, self._path(filename))
+            entries = self._read_index()
+            entries[key] = [filename, len(blob), meta]
+            self._evict(entries)
+            self._write_index(entries)
+        self._count('writes')
+
+    def _evict(self, entries):
+        total = sum(entry[1] for entry in entries.values())
+        if total <= self.max_bytes:
+            return
+
+        def used(key):
+            try:
+                return os.path.getmtime(self._path(entries[key][0]))
+            except OSError:
+                return 0
+
+        for key in sorted(entries, key=used):
+            if total <= self.max_bytes:
+                break
+            filename, size = entries.pop(key)[:2]
+            try:
+                os.remove(self._path(filename))
+            except OSError:
+                pass
+            total -= size
+            self._count('evictions')
+
+    @property
+    def nbytes(self):
+        return sum(entry[1] for entry in self._read_index().values())
+
+    def __len__(self):
+        return len(self._read_index())
+
+    def clear(self):
+        with self._locked():
+            for entry in self._read_index().values():
+                try:
+                    os.remove(self._path(entry[0]))
+                except OSError:
+                    pass
+            self._write_index({})
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""The element buttons of the periodic table, as data.
+
+One row per element (symbol, button label, colour group) and a grid of
+button ids, eight valence slots wide, drive the table in the layout, the
+inputs of the selection callback and the element list of the formula rules.
+"""
+import collections
+
+Element = collections.namedtuple('Element', 'id symbol name group slot duplicate_of')
+
+# Spaces each slot of the table leaves in the outer shell, left to right.
+VALENCES = [7, 6, 5, 4, 3, 2, 1, 0]
+
+# Button colour of each group.
+COLOURS = {
+    'alkali': 'rgb(252, 48, 45)',
+    'alkaline-earth': 'rgb(253, 169, 71)',
+    'transition': 'rgb(254, 223, 107)',
+    'inner-transition': 'rgb(113, 191, 66)',
+    'post-transition': 'rgb(158, 224, 98)',
+    'metalloid': 'rgb(77, 156, 199)',
+    'nonmetal': 'rgb(103, 179, 221)',
+    'halogen': 'rgb(154, 72, 180)',
+    'noble-gas': 'rgb(107, 38, 131)',
+}
+
+# Symbol, button label and colour group of every element.
+ELEMENTS = [
+    ('H', 'Hydrogen', 'nonmetal'), ('He', 'Helium', 'noble-gas'), ('Li', 'Lithium', 'alkali'),
+    ('Be', 'Berylium', 'alkaline-earth'), ('B', 'Boron', 'metalloid'), ('C', 'Carbon', 'nonmetal'),
+    ('N', 'Nitrogen', 'nonmetal'), ('O', 'Oxygen', 'nonmetal'), ('F', 'Flourine', 'halogen'),
+    ('Ne', 'Neon', 'noble-gas'), ('Na', 'Sodium', 'alkali'), ('Mg', 'Magnesium', 'alkaline-earth'),
+    ('Al', 'Aluminium', 'post-transition'), ('Si', 'Silicon', 'metalloid'), ('P', 'Phosorous', 'nonmetal'),
+    ('S', 'Sulphur', 'nonmetal'), ('Cl', 'Chlorine', 'halogen'), ('Ar', 'Argon', 'noble-gas'),
+    ('K', 'Potassium', 'alkali'), ('Ca', 'Calcium', 'alkaline-earth'), ('Sc', 'Scandium', 'transition'),
+    ('Ti', 'Titanium', 'transition'), ('V', 'Vanadium', 'transition'), ('Cr', 'Chromium', 'transition'),
+    ('Mn', 'Manganese', 'transition'), ('Fe', 'Iron', 'transition'), ('Co', 'Cobalt', 'transition'),
+    ('Ni', 'Nickel', 'transition'), ('Cu', 'Copper', 'transition'), ('Zn', 'Zinc', 'transition'),
+    ('Ga', 'Gallium', 'post-transition'), ('Ge', 'Germanium', 'metalloid'), ('As', 'Arsenic', 'metalloid'),
+    ('Se', 'Selenium', 'nonmetal'), ('Br', 'Bromium', 'halogen'), ('Kr', 'Krypton', 'noble-gas'),
+    ('Rb', 'Rubinium', 'alkali'), ('Sr', 'Strontium', 'alkaline-earth'), ('Y', 'Yttrium', 'transition'),
+    ('Zr', 'Zirconium', 'transition'), ('Nb', 'Niobium', 'transition'), ('Mo', 'Molybdenum', 'transition'),
+    ('Tc', 'Technetium', 'transition'), ('Ru', 'Ruthenium', 'transition'), ('Rh', 'Rhodium', 'transition'),
+    ('Pd', 'Palladium', 'transition'), ('Ag', 'Silver', 'transition'), ('Cd', 'Cadmium', 'transition'),
+    ('In', 'Indium', 'post-transition'), ('Sn', 'Tin', 'post-transition'), ('Sb', 'Antimony', 'metalloid'),
+    ('Te', 'Tellurium', 'metalloid'), ('I', 'Iodine', 'halogen'), ('Xe', 'Xenon', 'noble-gas'),
+    ('Cs', 'Cesium', 'alkali'), ('Ba', 'Barium', 'alkaline-earth'), ('La', 'Lanthanum', 'inner-transition'),
+    ('Ce', 'Cerium', 'inner-transition'), ('Pr', 'Praseodymium', 'inner-transition'),
+    ('Nd', 'Neodymium', 'inner-transition'), ('Pm', 'Promethium', 'inner-transition'),
+    ('Sm', 'Samarium', 'inner-transition'), ('Eu', 'Europium', 'inner-transition'),
+    ('Gd', 'Gadolinium', 'inner-transition'), ('Tb', 'Terbium', 'inner-transition'),
+    ('Dy', 'Dysprosium', 'inner-transition'), ('Ho', 'Holmium', 'inner-transition'),
+    ('Er', 'Erbium', 'inner-transition'), ('Tm', 'Thulium', 'inner-transition'),
+    ('Yb', 'Ytterbium', 'inner-transition'), ('Lu', 'Lutetium', 'inner-transition'),
+    ('Hf', 'Hafnium', 'transition'), ('Ta', 'Tantalum', 'transition'), ('W', 'Tungsten', 'transition'),
+    ('Re', 'Rhenium', 'transition'), ('Os', 'Osmium', 'transition'), ('Ir', 'Iridium', 'transition'),
+    ('Pt', 'Platinum', 'transition'), ('Au', 'Gold', 'transition'), ('Hg', 'Mercury', 'transition'),
+    ('Tl', 'Thallium', 'post-transition'), ('Pb', 'Lead', 'post-transition'),
+    ('Bi', 'Bismuth', 'post-transition'), ('Po', 'Polonium', 'nonmetal'), ('At', 'Astatine', 'halogen'),
+    ('Rn', 'Radon', 'noble-gas'), ('Fr', 'Francium', 'alkali'), ('Ra', 'Radium', 'alkaline-earth'),
+    ('Ac', 'Actinium', 'inner-transition'), ('Th', 'Thorium', 'inner-transition'),
+    ('Pa', 'Protactinium', 'inner-transition'), ('U', 'Uranium', 'inner-transition'),
+    ('Np', 'Neptunium', 'inner-transition'), ('Pu', 'Plutonium', 'inner-transition'),
+    ('Am', 'Americium', 'inner-transition'), ('Cm', 'Curium', 'inner-transition'),
+    ('Bk', 'Berkelium', 'inner-transition'), ('Cf', 'Californium', 'inner-transition'),
+    ('Es', 'Einsteinium', 'inner-transition'), ('Fm', 'Fermium', 'inner-transition'),
+    ('Md', 'Mendelevium', 'inner-transition'), ('No', 'Nobelium', 'inner-transition'),
+    ('Lr', 'Lawrencium', 'inner-transition'), ('Rf', 'Rutherfordiu', 'transition'),
+    ('Db', 'Dubnium', 'transition'), ('Sg', 'Seaborgium', 'transition'), ('Bh', 'Bohrium', 'transition'),
+    ('Hs', 'Hassium', 'transition'), ('Mt', 'Meitnerium', 'transition'),
+    ('Ds', 'Darmstadtium', 'inner-transition'), ('Rg', 'Roentgenium', 'transition'),
+    ('Cn', 'Copernicium', 'transition'), ('Uut', 'Nihonium', 'post-transition'),
+    ('Fl', 'Flerovium', 'post-transition'), ('Uup', 'Moscovium', 'post-transition'),
+    ('Lv', 'Livermorium', 'post-transition'), ('Uus', 'Tennessine', 'halogen'),
+    ('Uuo', 'Oganesson', 'noble-gas')]
+
+# Button ids row by row; '' is an empty slot, and an id ending in 1 is the
+# repeated copy of an element that the table shows twice.
+GRID = [
+    ['', '', '', '', '', '', 'H', 'He'],
+    ['Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne'],
+    ['Na', 'Mg', 'Al', 'Si', 'P', 'S', 'Cl', 'Ar'],
+    ['K', 'Ca', 'Sc', 'Ti', 'V', 'Cr', 'K1', 'Ca1'],
+    ['Sc1', 'Ti1', 'V1', 'Cr1', 'Mn', 'Fe', 'Co', 'Ni'],
+    ['Cu', 'Zn', 'Ga', 'Ge', 'As', 'Se', 'Br', 'Kr'],
+    ['Rb', 'Sr', 'Y', 'Zr', 'Nb', 'Mo', 'Rb1', 'Sr1'],
+    ['Y1', 'Zr1', 'Nb1', 'Mo1', 'Tc', 'Ru', 'Rh', 'Pd'],
+    ['Ag', 'Cd', 'In', 'Sn', 'Sb', 'Te', 'I', 'Xe'],
+    ['Cs', 'Ba', 'La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm'],
+    ['Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb'],
+    ['Lu', 'Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt'],
+    ['Au', 'Hg', 'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn'],
+    ['Fr', 'Ra', 'Ac', 'Th', 'Pa', 'U', 'Np', 'Pu'],
+    ['Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm', 'Md', 'No'],
+    ['Lr', 'Rf', 'Db', 'Sg', 'Bh', 'Hs', 'Mt', 'Ds'],
+    ['Rg', 'Cn', 'Uut', 'Fl', 'Uup', 'Lv', 'Uus', 'Uuo'],
+]
+
+
+_DATA = dict((symbol, (name, group)) for symbol, name, group in ELEMENTS)
+
+SYMBOLS = [symbol for symbol, _, _ in ELEMENTS]
+
+
+def _element(button, slot):
+    duplicate_of = button[:-1] if button.endswith('1') and button[:-1] in _DATA else None
+    symbol = duplicate_of or button
+    name, group = _DATA[symbol]
+    return Element(button, symbol, name, group, slot, duplicate_of)
+
+
+ROWS = [[_element(button, slot) if button else None for slot, button in enumerate(row)] for row in GRID]
+
+# Every element button in page order.
+BUTTONS = [element for row in ROWS for element in row if element is not None]
+
+# Button styles, one rule per colour group, so the layout only names a class.
+STYLESHEET = '\n'.join(
+    ['button.element{width:11.9%;color:white;background-color:white}'] +
+    ['button.element-{}{{background-color:{}}}'.format(group, colour) for group, colour in sorted(COLOURS.items())])
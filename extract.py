@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Lean extraction of dictionary rows from the formula tables.
+
+Walks the ``<tr>``/``<td>`` elements of a table once with lxml and yields
+plain ``(formula, synonyms, CAS number, href)`` tuples, instead of building
+a DataFrame with ``pd.read_html`` for every table.
+
+Pages are parsed incrementally from the byte stream: only the subtrees we are
+after are kept, everything else is dropped as soon as it has been parsed, and
+parsing stops once the last wanted table has been seen.
+"""
+import io
+
+COLUMNS = 3
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _text(cell):
+    return ' '.join(''.join(cell.itertext()).split())
+
+
+def _href(row):
+    for link in row.iter('a'):
+        href = link.get('href')
+        if href:
+            return href
+    return ''
+
+
+def rows(table):
+    """Row tuples of an lxml ``<table>`` element.
+
+    Header rows are skipped and cells spanning several rows are repeated
+    in each of them.
+    """
+    spans = {}
+    for tr in table.iter('tr'):
+        cells = [cell for cell in tr if cell.tag in ('td', 'th')]
+        if not any(cell.tag == 'td' for cell in cells):
+            continue
+        values = []
+        column = 0
+        while len(values) < COLUMNS and (cells or column in spans):
+            if column in spans:
+                value, left = spans[column]
+                if left > 1:
+                    spans[column] = (value, left - 1)
+                else:
+                    del spans[column]
+            else:
+                cell = cells.pop(0)
+                value = _text(cell)
+                span = cell.get('rowspan', '1').strip()
+                rowspan = int(span) if span.isdigit() else 1
+                if rowspan > 1:
+                    spans[column] = (value, rowspan - 1)
+            values.append(value)
+            column += 1
+        values += [''] * (COLUMNS - len(values))
+        yield tuple(values) + (_href(tr),)
+
+
+def chunks(response, size=CHUNK_SIZE):
+    """Read a file-like ``response`` in blocks of ``size`` bytes."""
+    while True:
+        block = response.read(size)
+        if not block:
+            return
+        yield block
+
+
+def iterparse(blocks, encoding='utf-8'):
+    """``(event, element)`` pairs for the start and end of each HTML element."""
+    # Imported here: workers answering from the dictionary store never parse HTML.
+    from lxml import etree
+    parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+    for block in blocks:
+        parser.feed(block)
+        for event in parser.read_events():
+            yield event
+    parser.close()
+    for event in parser.read_events():
+        yield event
+
+
+def _discard(element):
+    """Free an element that has been parsed, along with its earlier siblings."""
+    element.clear()
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def stream_tables(blocks, ids):
+    """``{table id: [row tuples]}`` for every id in ``ids``, parsed from ``blocks``."""
+    wanted = set(ids)
+    found = {}
+    inside = None
+    for event, element in iterparse(blocks):
+        if event == 'start':
+            if inside is None and element.get('id') in wanted:
+                inside = element
+        elif element is inside:
+            found[element.get('id')] = list(rows(element))
+            inside = None
+            _discard(element)
+            if len(found) == len(wanted):
+                break
+        elif inside is None:
+            _discard(element)
+    return found
+
+
+def tables(html, ids):
+    """``{table id: [row tuples]}`` for every id in ``ids`` found in ``html``."""
+    if not isinstance(html, bytes):
+        html = html.encode('utf-8')
+    return stream_tables(chunks(io.BytesIO(html)), ids)
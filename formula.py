@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Chemical formula rules.
+
+Formulas are handled as element -> count maps. The Hill-order key built
+here indexes and looks up the dictionary, so the order in which elements
+were clicked does not matter. The formula shown for a selection is built
+in the browser (assets/chemistry.js) from the orders, ions and dictionary
+aliases that rules() hands it.
+"""
+import collections
+import re
+
+import elements
+
+_TOKEN = re.compile(r'([A-Z][a-z]*)(\d*)|(\()|\)(\d*)')
+
+ALPHABETICAL = sorted(elements.SYMBOLS)
+
+# Ionic compounds are written from the most electropositive element down.
+IONIC = [
+    'Cs', 'Fr', 'K', 'Rb', 'Ba', 'Ra', 'Na', 'Sr', 'Li', 'Ca', 'Yb', 'La', 'Ac', 'Ce', 'Pr', 'Pm', 'Nd', 'Sm',
+    'Tb', 'Gd', 'Eu', 'Dy', 'Y', 'Ho', 'Er', 'Tm', 'Lu', 'Pu', 'No', 'Es', 'Th', 'Hf', 'Md', 'Bk', 'Am', 'Lr',
+    'Cf', 'Cm', 'Fm', 'Mg', 'Zr', 'Np', 'Sc', 'U', 'Ta', 'Pa', 'Ti', 'Mn', 'Be', 'Nb', 'Al', 'V', 'Zn', 'Cr',
+    'Cd', 'In', 'Ga', 'Fe', 'Co', 'Si', 'Re', 'Tc', 'Cu', 'Ni', 'Ag', 'Sn', 'Po', 'Hg', 'Ge', 'Bi', 'Tl', 'B',
+    'Sb', 'Te', 'Mo', 'As', 'P', 'H', 'Ir', 'Ru', 'Os', 'At', 'Rn', 'Pd', 'Pt', 'Rh', 'Pb', 'W', 'Au', 'C',
+    'Se', 'S', 'Xe', 'I', 'Br', 'Kr', 'N', 'Cl', 'O', 'F', 'He', 'Ne', 'Ar', 'Rf', 'Db', 'Sg', 'Bh', 'Hs', 'Mt',
+    'Ds', 'Rg', 'Cn', 'Uut', 'Fl', 'Uup', 'Lv', 'Uus', 'Uuo']
+
+# Element order for each compound structure button.
+ORDERS = {
+    'organic': ['C', 'H'] + [e for e in ALPHABETICAL if e not in ('C', 'H')],
+    'ionic': IONIC,
+    'oxide': [e for e in ALPHABETICAL if e != 'O'] + ['O'],
+    'hydro': [e for e in ALPHABETICAL if e not in ('O', 'H')] + ['O', 'H'],
+}
+
+# Polyatomic ions factored out of a formula, largest first so that SO4 wins
+# over SO3. Cations are written before the rest of the formula.
+CATIONS = ['NH4']
+ANIONS = ['SeO4', 'SO4', 'PO4', 'ClO4', 'ClO3', 'CO3', 'NO3', 'SO3', 'NO2', 'CN', 'OH']
+
+# Formulas the dictionary writes in a form the rules here do not produce.
+DICTIONARY_FORMS = [
+    'NH4Cl', 'Al(OH)3', 'Al(NO2)3', 'Al(NO3)3', 'Al2(CO3)3', 'Al2(SO4)3', 'Al2Si2O5(OH)4', 'Au(OH)3',
+    'Au2(SeO4)3']
+
+# Selections the dictionary files under a different formula altogether.
+SUBSTITUTIONS = {'LiH': 'DLi', 'HBr': 'DBr', 'KBr': 'KBR'}
+
+
+def parse(text):
+    """Element -> count map of a formula such as ``Al2(SO4)3``.
+
+    Raises ValueError for anything that is not a plain formula, e.g. hydrates
+    or charges.
+    """
+    stack = [collections.Counter()]
+    pos = 0
+    text = ''.join(str(text).split())
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            raise ValueError('cannot parse formula {!r}'.format(text))
+        symbol, count, opening, multiplier = match.groups()
+        if symbol:
+            stack[-1][symbol] += int(count or 1)
+        elif opening:
+            stack.append(collections.Counter())
+        else:
+            if len(stack) == 1:
+                raise ValueError('unbalanced ) in formula {!r}'.format(text))
+            group = stack.pop()
+            for symbol, count in group.items():
+                stack[-1][symbol] += count * int(multiplier or 1)
+        pos = match.end()
+    if len(stack) != 1 or not stack[0]:
+        raise ValueError('cannot parse formula {!r}'.format(text))
+    return dict(stack[0])
+
+
+def _format(counts, order):
+    rank = dict((symbol, n) for n, symbol in enumerate(order))
+    symbols = sorted((s for s in counts if counts[s] > 0), key=lambda s: (rank.get(s, len(rank)), s))
+    return ''.join(s if counts[s] == 1 else '{}{}'.format(s, counts[s]) for s in symbols)
+
+
+def hill(counts):
+    """Hill-order key: C then H first when carbon is present, the rest alphabetical."""
+    if counts.get('C', 0) > 0:
+        return _format(counts, ['C', 'H'])
+    return _format(counts, [])
+
+
+def normalize(text):
+    """``text`` with all whitespace removed, as formulas are keyed in the dictionary."""
+    return ''.join(str(text).split())
+
+
+def hill_key(text):
+    """Hill-order form of the formula ``text``, or None if it cannot be parsed."""
+    try:
+        return hill(parse(text))
+    except ValueError:
+        return None
+
+
+def _aliases():
+    aliases = dict((hill(parse(f)), f) for f in DICTIONARY_FORMS)
+    aliases.update((hill(parse(k)), v) for k, v in SUBSTITUTIONS.items())
+    return aliases
+
+
+ALIASES = _aliases()
+
+
+def rules():
+    """The data the browser needs to build formulas the same way (assets/chemistry.js)."""
+    return {
+        'orders': ORDERS,
+        'ions': [[ion, parse(ion), ion in CATIONS] for ion in CATIONS + ANIONS],
+        'aliases': ALIASES,
+    }
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""gunicorn settings (``gunicorn -c gunicorn.conf.py app:server``).
+
+The app is imported once in the master and warmed up there (warmup.py), so
+workers are forked with the dictionary, Dash setup and layout already loaded
+and shared copy-on-write.
+"""
+import os
+
+bind = '0.0.0.0:{}'.format(os.environ.get('PORT', '8000'))
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+preload_app = True
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""In-memory hash index from formula to dictionary rows.
+
+Built once per worker from the snapshot so a Search is a single dict probe
+instead of a parse and a scan of the letter's table. Rows are keyed by their
+Hill-order formula as well, so ``NH4Cl`` and ``ClH4N`` find the same row,
+and the article to show for a formula is found the same way.
+"""
+import collections
+import threading
+
+import formula
+import snapshot
+
+Record = collections.namedtuple('Record', 'formula synonyms cas href table position')
+
+_lock = threading.Lock()
+_index = None
+
+
+class FormulaIndex(object):
+
+    def __init__(self, tables, articles=None):
+        records = {}
+        hills = {}
+        for tid in snapshot.table_ids():
+            for position, row in enumerate(tables.get(tid, ())):
+                href = row[3] if len(row) > 3 else None
+                record = Record(row[0], row[1], row[2], href or None, tid, position)
+                records.setdefault(formula.normalize(row[0]), []).append(record)
+                key = formula.hill_key(row[0])
+                if key is not None:
+                    hills.setdefault(key, []).append(record)
+        self._records = dict((key, tuple(value)) for key, value in records.items())
+        self._hills = dict((key, tuple(value)) for key, value in hills.items())
+        self._articles = snapshot.articles(tables) if articles is None else articles
+        # Rough memory footprint, used to budget caches of per-table indexes.
+        self.nbytes = sum(len(r.formula) + len(r.synonyms) + len(r.cas) + len(r.href or '') + 256
+                          for value in self._records.values() for r in value)
+
+    def __len__(self):
+        return len(self._records)
+
+    def lookup(self, text):
+        """All records for formula ``text``; empty if it is not in the dictionary.
+
+        Rows spelled exactly like ``text`` come back alone; otherwise every row
+        with the same Hill-order formula does.
+        """
+        found = self._records.get(formula.normalize(text))
+        if found:
+            return found
+        key = formula.hill_key(text)
+        if key is None:
+            return ()
+        return self._hills.get(key, ())
+
+    def article(self, text):
+        """Wikipedia path of the article for formula ``text``, or None."""
+        found = self._articles.get(formula.normalize(text))
+        if found is None:
+            found = self._articles.get(formula.hill_key(text))
+        return found
+
+
+def get():
+    """The process-wide index, built from the snapshot on first use.
+
+    None when there is no snapshot to build it from.
+    """
+    global _index
+    with _lock:
+        if _index is None:
+            data = snapshot.load()
+            if data is None:
+                return None
+            _index = FormulaIndex(data['tables'], data['articles'])
+        return _index
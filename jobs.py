@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Background jobs for work that waits on the network.
+
+Search used to block a gunicorn worker for as long as its upstream fetches
+took. The callback now starts a job here and returns straight away; the
+page polls for the result with a dcc.Interval.
+
+Jobs are keyed by what they compute rather than by a random id, so a poll
+that lands on a worker which never saw the job simply starts it there, and
+starting a job that is already running or finished returns the same one.
+Finished jobs are kept, up to ``MAX_JOBS``, until forgotten, so a late
+poll is answered from the result instead of running the lookups again.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import collections
+import os
+import threading
+
+import metrics
+
+# Threads running jobs, and how many jobs to keep before dropping finished ones.
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 4))
+MAX_JOBS = int(os.environ.get('MAX_JOBS', 64))
+
+executor = ThreadPoolExecutor(max_workers=JOB_WORKERS)
+
+_lock = threading.Lock()
+_jobs = collections.OrderedDict()
+
+
+def _finished(future):
+    metrics.incr('jobs.failed' if future.exception() is not None else 'jobs.completed')
+
+
+def start(key, fn, *args):
+    """Run ``fn(*args)`` in the background under ``key``, unless it already is.
+
+    Returns ``key``, the id to poll with result().
+    """
+    with _lock:
+        if key in _jobs:
+            _jobs.move_to_end(key)
+            return key
+        future = _jobs[key] = executor.submit(fn, *args)
+        for old in list(_jobs):
+            if len(_jobs) <= MAX_JOBS:
+                break
+            if _jobs[old].done():
+                del _jobs[old]
+    metrics.incr('jobs.started')
+    future.add_done_callback(_finished)
+    return key
+
+
+def result(key):
+    """The Future of job ``key``, or None if this worker has no such job."""
+    with _lock:
+        return _jobs.get(key)
+
+
+def forget(key):
+    """Drop job ``key``, so that the next start() runs it again."""
+    with _lock:
+        _jobs.pop(key, None)
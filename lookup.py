@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""Shared lookup service behind the Search callbacks.
+
+One Search fires the textbox-2 and interweb callbacks at the same time. Both
+go through this module, and identical requests that are in flight together
+(same formula, same upstream URL) share a single fetch and parse.
+
+Cached tables and articles are served even once they are past their TTL;
+they are refreshed in the background, so a slow or failing upstream never
+holds up a search that has something to show (see also upstream's circuit
+breakers).
+
+search() runs both lookups for a formula at once; app.py runs it as a
+background job (see jobs.py).
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+import re
+import threading
+
+import cache
+import index
+import metrics
+import render
+import snapshot
+import store
+import upstream
+
+WIKIPEDIA_URL = 'https://en.wikipedia.org{}'
+
+# Budget and lifetime of the parsed dictionary tables kept when no snapshot
+# ships with the app.
+TABLE_CACHE_BYTES = int(os.environ.get('TABLE_CACHE_BYTES', 16 * 1024 * 1024))
+TABLE_CACHE_TTL = float(os.environ.get('TABLE_CACHE_TTL', 6 * 60 * 60))
+
+# Where fetched article bodies are kept, shared by all workers and restarts.
+ARTICLE_CACHE_DIR = os.environ.get(
+    'ARTICLE_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'articles'))
+ARTICLE_CACHE_BYTES = int(os.environ.get('ARTICLE_CACHE_BYTES', 64 * 1024 * 1024))
+ARTICLE_CACHE_TTL = float(os.environ.get('ARTICLE_CACHE_TTL', 7 * 24 * 60 * 60))
+
+# Threads fetching articles while search() looks up the rows.
+FETCH_WORKERS = int(os.environ.get('FETCH_WORKERS', 4))
+
+
+class SingleFlight(object):
+    """Let one caller per key do the work while concurrent callers wait for it."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, *args):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+        if not leader:
+            metrics.incr('lookup.coalesced')
+            return call.result()
+        try:
+            call.set_result(fn(*args))
+        except Exception as error:
+            call.set_exception(error)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return call.result()
+
+
+flight = SingleFlight()
+
+executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+
+
+tables = cache.LRUCache('tables', TABLE_CACHE_BYTES, TABLE_CACHE_TTL)
+
+# ETag, Last-Modified and content hash of the page each url's tables came from.
+_table_validators = {}
+
+# Rendered articles, kept apart for each version of the rendering.
+articles = cache.DiskCache(
+    'articles', os.path.join(ARTICLE_CACHE_DIR, 'v{}'.format(render.VERSION)), ARTICLE_CACHE_BYTES, ARTICLE_CACHE_TTL)
+
+
+_refreshing_lock = threading.Lock()
+_refreshing = set()
+
+
+def _revalidate(key, fn, *args):
+    """Run ``fn(*args)`` in the background, unless ``key`` is already being refreshed."""
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+    metrics.incr('lookup.revalidations')
+
+    def run():
+        try:
+            flight.do(key, fn, *args)
+        except Exception:
+            metrics.incr('lookup.revalidation_errors')
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    executor.submit(run)
+
+
+def _load_tables(url):
+    # Tables missing from the page are cached empty so they are not refetched
+    # on every lookup. A refresh that finds the page unchanged keeps the
+    # indexes already built and only restarts their TTL.
+    validators = _table_validators.get(url)
+    data = snapshot.fetch(url, validators)
+    if data is None:
+        kept = dict((tid, tables.get_stale((url, tid))[0]) for tid in snapshot.table_ids())
+        if all(table is not None for table in kept.values()):
+            metrics.incr('lookup.tables_unchanged')
+            for tid, table in kept.items():
+                tables.put((url, tid), table, table.nbytes)
+            return kept
+        data = snapshot.fetch(url)
+    _table_validators[url] = data['validators']
+    found = data['tables']
+    loaded = {}
+    for tid in snapshot.table_ids():
+        table = loaded[tid] = index.FormulaIndex({tid: found.get(tid, ())})
+        tables.put((url, tid), table, table.nbytes)
+    return loaded
+
+
+def _table(url, tid):
+    table, expired = tables.get_stale((url, tid))
+    if table is None:
+        table = flight.do(('tables', url), _load_tables, url).get(tid)
+    elif expired:
+        _revalidate(('tables', url), _load_tables, url)
+    return table
+
+
+def records(chem):
+    """Dictionary records for the formula ``chem``.
+
+    Answered from the shared store (or the snapshot index) when there is
+    one. Otherwise only the tables of the letters ``chem`` can be filed
+    under are looked at, parsed from the live page and kept in the
+    ``tables`` cache.
+    """
+    dictionary = store.get()
+    if dictionary is not None:
+        return dictionary.lookup(chem)
+    found = ()
+    for letter in sorted(set(re.findall('[A-Z]', chem)), key=lambda c: c != chem[:1]):
+        for tid in snapshot.table_ids(letter):
+            table = _table(snapshot.DICTIONARY_URL, tid)
+            if table is not None:
+                found += table.lookup(chem)
+    return found
+
+
+def article_href(chem, cached_only=False):
+    """Wikipedia path of the article for ``chem``, or None.
+
+    A lookup in the formula -> article map built with the dictionary tables;
+    with ``cached_only`` only tables already in the cache are looked at.
+    """
+    dictionary = store.get()
+    if dictionary is not None:
+        return dictionary.article(chem)
+    for letter in sorted(set(re.findall('[A-Z]', chem)), key=lambda c: c != chem[:1]):
+        for tid in snapshot.table_ids(letter):
+            if cached_only:
+                table = tables.get_stale((snapshot.DICTIONARY_URL, tid))[0]
+            else:
+                table = _table(snapshot.DICTIONARY_URL, tid)
+            href = table.article(chem) if table is not None else None
+            if href is not None:
+                return href
+    return None
+
+
+def _fetch_article(url, validators=None):
+    """``(changed, rendered lead, validators)``; the lead is None if the page has none."""
+    page, found = upstream.get_if_changed(url, validators)
+    if page is None:
+        return False, None, found
+    return True, render.article(page), found
+
+
+def _store_article(href):
+    url = WIKIPEDIA_URL.format(href)
+    changed, body, validators = _fetch_article(url, articles.meta(href))
+    if not changed:
+        # Unchanged upstream: keep the cached copy and restart its TTL.
+        body = articles.get(href)
+        if body is None:
+            changed, body, validators = _fetch_article(url)
+    if body is not None:
+        articles.put(href, body, validators)
+    return body
+
+
+def article(chem):
+    """Lead of the Wikipedia article for ``chem`` (see render), or None if there is none.
+
+    Served from the on-disk ``articles`` cache when it has been fetched
+    before, and refreshed in the background once that copy is too old.
+    """
+    href = article_href(chem)
+    if href is None:
+        return None
+    body, expired = articles.get_stale(href)
+    if body is None:
+        return flight.do(('article', href), _store_article, href)
+    if expired:
+        _revalidate(('article', href), _store_article, href)
+    return body
+
+
+def cached_article(chem):
+    """The cached lead of the article for ``chem``, expired or not, or None.
+
+    Never fetches anything: articles are fetched by the Search job, through
+    article().
+    """
+    href = article_href(chem, cached_only=True)
+    if href is None:
+        return None
+    return articles.get_stale(href)[0]
+
+
+def search(chem):
+    """``(rows, article body)`` for ``chem``, looked up side by side.
+
+    The article is fetched on the lookup executor while the rows are found
+    here. Either is None if its upstream could not be reached. The article
+    is extra: no error fetching or rendering it keeps the rows from being
+    returned.
+    """
+    pending = executor.submit(article, chem)
+    try:
+        rows = [tuple(record[:3]) for record in records(chem)]
+    except upstream.FetchError:
+        rows = None
+    try:
+        body = pending.result()
+    except upstream.FetchError:
+        body = None
+    except Exception:
+        metrics.incr('search.article_errors')
+        body = None
+    return rows, body
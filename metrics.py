@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Process-wide counters and gauges, served as JSON on /metrics.
+
+Each gunicorn worker keeps its own counts.
+"""
+import collections
+import threading
+
+_lock = threading.Lock()
+_counters = collections.Counter()
+_gauges = {}
+
+
+def incr(name, amount=1):
+    with _lock:
+        _counters[name] += amount
+
+
+def gauge(name, value):
+    """Record the current ``value`` of ``name``, e.g. a circuit breaker state."""
+    with _lock:
+        _gauges[name] = value
+
+
+def counters():
+    with _lock:
+        return dict(_counters)
+
+
+def report():
+    """Counters and gauges in one flat dict."""
+    with _lock:
+        found = dict(_counters)
+        found.update(_gauges)
+        return found
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Responses whose body is fixed once the app has started.
+
+The body is compressed once, up front, with brotli and with gzip, and each
+encoding gets its own strong ETag, so a request costs a header check and a
+copy of bytes that already exist: a 304 when the browser has it, otherwise
+the smallest encoding it accepts. Everything else is compressed per
+response by Flask-Compress (see app.py).
+"""
+import gzip
+import hashlib
+
+import brotli
+import flask
+from werkzeug.http import parse_accept_header
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+# Cache-Control for URLs that change whenever their content does.
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+
+def fingerprinted(request=None):
+    """Whether the URL carries a version or content fingerprint (``?v=`` or ``?m=``)."""
+    request = request or flask.request
+    return bool(request.args.get('v') or request.args.get('m'))
+
+
+class Payload(object):
+    """One fixed body, kept as is, brotli-compressed and gzipped."""
+
+    def __init__(self, data, mimetype, source=None):
+        self.source = source
+        self.mimetype = mimetype
+        self.etag = hashlib.sha1(data).hexdigest()
+        # Smallest first, so the first encoding the request accepts wins.
+        self.encodings = [
+            ('br', brotli.compress(data, quality=BROTLI_QUALITY)),
+            ('gzip', gzip.compress(data, GZIP_LEVEL)),
+            (None, data)]
+
+    def response(self, request=None, immutable=False):
+        """The response to ``request``; ``immutable`` for fingerprinted URLs."""
+        request = request or flask.request
+        accepted = parse_accept_header(request.headers.get('Accept-Encoding'))
+        encoding, data = next((encoding, data) for encoding, data in self.encodings
+                              if encoding is None or accepted[encoding] > 0)
+        etag = '{}-{}'.format(self.etag, encoding) if encoding else self.etag
+        response = flask.Response(mimetype=self.mimetype)
+        response.set_etag(etag)
+        response.vary.add('Accept-Encoding')
+        if immutable:
+            response.headers['Cache-Control'] = IMMUTABLE
+        else:
+            # Always revalidate: the ETag changes with every deploy that changes the body.
+            response.cache_control.no_cache = True
+        if etag in request.if_none_match:
+            response.status_code = 304
+            return response
+        response.set_data(data)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        return response
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Turn a Wikipedia article page into the small document shown in the iframe.
+
+The whole article body used to be sent, serialized once per nesting level.
+Only the lead section is kept now: the infobox (the chembox, for compounds)
+and the paragraphs before the first heading. Elements and attributes not on
+the allow-lists below are dropped, so no scripts, styles, navigation or
+event handlers get through, and the result is capped at ``MAX_BYTES``.
+"""
+
+# Bump when the output changes, so cached renderings are not reused.
+VERSION = 2
+
+MAX_BYTES = 64 * 1024
+
+BASE_URL = 'https://en.wikipedia.org/'
+
+ALLOWED_TAGS = {
+    'a', 'abbr', 'b', 'br', 'caption', 'code', 'div', 'em', 'i', 'img', 'li', 'ol', 'p', 'small', 'span',
+    'sub', 'sup', 'table', 'tbody', 'td', 'th', 'thead', 'tr', 'ul'}
+
+ALLOWED_ATTRIBUTES = {'alt', 'class', 'colspan', 'height', 'href', 'rowspan', 'src', 'title', 'width'}
+
+# Parts of the lead that are page furniture rather than content.
+DROPPED_CLASSES = {
+    'hatnote', 'metadata', 'mw-editsection', 'mw-empty-elt', 'navbox', 'noprint', 'reference', 'shortdescription',
+    'sistersitebox'}
+
+TEMPLATE = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<base href="{base}" target="_blank">
+<style>body{{font-family:sans-serif;font-size:14px}}.infobox{{float:right;margin:0 0 1em 1em;font-size:12px;border:1px solid #ccc}}</style>
+</head>
+<body>
+{content}
+</body>
+</html>'''
+
+
+def _dropped(element):
+    if not isinstance(element.tag, str):
+        return True
+    classes = set(element.get('class', '').split())
+    return bool(classes & DROPPED_CLASSES) or element.tag in ('script', 'style', 'link', 'meta')
+
+
+def _clean(element):
+    """Strip ``element`` in place down to the allowed tags and attributes."""
+    for child in list(element):
+        if _dropped(child):
+            child.drop_tree()
+        else:
+            _clean(child)
+            if child.tag not in ALLOWED_TAGS:
+                child.drop_tag()
+    for name in list(element.attrib):
+        value = element.get(name)
+        if name not in ALLOWED_ATTRIBUTES or value.lower().lstrip().startswith('javascript:'):
+            del element.attrib[name]
+        elif name == 'src' and value.startswith('//'):
+            element.set(name, 'https:' + value)
+
+
+def _lead(root):
+    """The infobox and paragraphs of the lead section, in page order."""
+    # Only inside #mw-content-text: the page indicators above it have an
+    # .mw-parser-output of their own.
+    text = root.get_element_by_id('mw-content-text', None)
+    content = text.find_class('mw-parser-output') if text is not None else []
+    if not content:
+        return []
+    parts = []
+    for child in content[0]:
+        if not isinstance(child.tag, str):
+            continue
+        classes = set(child.get('class', '').split())
+        if child.tag in ('h2', 'h3') or 'mw-heading' in classes:
+            break
+        if child.tag == 'p' or (child.tag == 'table' and 'infobox' in classes):
+            parts.append(child)
+    return parts
+
+
+def article(page):
+    """The lead of the article ``page`` (bytes) as a standalone HTML document.
+
+    Returns None if the page has no article content or cannot be parsed.
+    """
+    # Imported here, on the first article that is not cached yet.
+    from lxml import etree
+    from lxml import html as lxml_html
+    try:
+        root = lxml_html.fromstring(page)
+    except (etree.ParserError, etree.XMLSyntaxError, ValueError):
+        # Empty or truncated page.
+        return None
+    pieces = []
+    size = 0
+    for part in _lead(root):
+        _clean(part)
+        if part.tag == 'p' and not part.text_content().strip():
+            continue
+        piece = etree.tostring(part, encoding='unicode', method='html', with_tail=False)
+        length = len(piece.encode('utf-8'))
+        if size + length > MAX_BYTES:
+            # Skip what does not fit, such as a huge chembox, and keep the
+            # paragraphs after it.
+            continue
+        pieces.append(piece)
+        size += length
+    if not pieces:
+        return None
+    return TEMPLATE.format(base=BASE_URL, content='\n'.join(pieces))
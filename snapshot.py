@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""Offline snapshot of the Dictionary of chemical formulas.
+
+The Search callbacks used to download and parse the whole IPFS copy of the
+dictionary on every click. The page is now turned into a small gzipped JSON
+file once (``python snapshot.py``, run by ``bin/post_compile`` on deploy) and
+each worker loads it a single time. ``fetch`` is also used to parse the live
+page when no snapshot is available.
+
+Each snapshot records the page's ETag, Last-Modified and content hash;
+rebuilding sends them along, so an unchanged page is neither downloaded nor
+parsed again.
+"""
+import argparse
+import gzip
+import json
+import os
+import posixpath
+import threading
+import time
+
+import extract
+import formula
+import upstream
+
+SNAPSHOT_VERSION = 3
+
+DICTIONARY_URL = "https://ipfs.io/ipfs/QmXoypizjW3WknFiJnKLwHCnL72vedxjQkDDP1mXWo6uco/wiki/Dictionary_of_chemical_formulas.html"
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'dictionary.json.gz')
+
+# id of the table holding each letter of the dictionary; 'C' is split in two.
+periodics = {'A': 'mwKA', 'B': 'mwBBM', 'C': ('mwB1w', 'mwEtM'), 'D': 'mwGao', 'E': 'mwGfc', 'F': 'mwGoA', 'G': 'mwIJQ', 'H': 'mwISM', 'I': 'mwJBE', 'K': 'mwJOo', 'L': 'mwJdM', 'M': 'mwJxk', 'N': 'mwKS8', 'O': 'mwLNU', 'P': 'mwLRk', 'R': 'mwLeA', 'S': 'mwLoU', 'T': 'mwMNw', 'U': 'mwMgg', 'V': 'mwMnA', 'W': 'mwMrI', 'Y': 'mwM34', 'Z': 'mwNCM'}
+
+_lock = threading.Lock()
+_snapshot = None
+
+
+def table_ids(letter=None):
+    """Table ids for ``letter``, or for the whole dictionary in page order."""
+    if letter is not None:
+        ids = periodics.get(letter, ())
+        return ids if isinstance(ids, tuple) else (ids,)
+    return [tid for key in sorted(periodics) for tid in table_ids(key)]
+
+
+def article_path(href):
+    """Wikipedia path (``/wiki/Title``) for a link on the dictionary page.
+
+    The IPFS copy links articles as ``./Title.html``; Wikipedia itself uses
+    ``/wiki/Title``. Returns None for links that are not to an article.
+    """
+    if not href or '://' in href or href.startswith('#'):
+        return None
+    path = href.split('#', 1)[0]
+    if path.endswith('.html'):
+        path = path[:-len('.html')]
+    title = posixpath.basename(path)
+    if not title or ':' in title:
+        return None
+    return '/wiki/' + title
+
+
+def articles(tables):
+    """``{formula: article path}`` for every row that links to an article.
+
+    Keyed by the formula as written and by its Hill-order form; the first row
+    of the dictionary wins when several share a key.
+    """
+    found = {}
+    for tid in table_ids():
+        for row in tables.get(tid, ()):
+            path = article_path(row[3] if len(row) > 3 else None)
+            if path is None:
+                continue
+            for key in (formula.normalize(row[0]), formula.hill_key(row[0])):
+                if key:
+                    found.setdefault(key, path)
+    return found
+
+
+def build(html, source=DICTIONARY_URL):
+    """Extract every letter table of the dictionary page into a snapshot.
+
+    Each row is ``[formula, synonyms, CAS number, href]``; ``articles`` maps
+    formulas to the Wikipedia article to show for them.
+    """
+    return _snapshot_of(extract.tables(html, table_ids()), source)
+
+
+def _snapshot_of(found, source):
+    tables = dict((tid, [list(row) for row in rows]) for tid, rows in found.items())
+    return {
+        'version': SNAPSHOT_VERSION,
+        'source': source,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'tables': tables,
+        'articles': articles(tables),
+    }
+
+
+def fetch(url=DICTIONARY_URL, validators=None):
+    """Build a snapshot of the page at ``url``.
+
+    ``validators`` are those of an earlier snapshot of the same page: the
+    request is then conditional, and None is returned when the page comes
+    back 304 (nothing is parsed) or with the same content hash. The tables
+    are parsed from the body as it is downloaded.
+    """
+    tables, found = upstream.get_if_changed(
+        url, validators, parse=lambda blocks: extract.stream_tables(blocks, table_ids()))
+    if tables is None:
+        return None
+    data = _snapshot_of(tables, url)
+    data['validators'] = found
+    return data
+
+
+def read(path=SNAPSHOT_PATH):
+    with gzip.open(path, 'rt', encoding='utf-8') as fh:
+        data = json.load(fh)
+    if data.get('version') != SNAPSHOT_VERSION:
+        raise ValueError('snapshot {} has version {}, expected {}'.format(
+            path, data.get('version'), SNAPSHOT_VERSION))
+    return data
+
+
+def write(data, path=SNAPSHOT_PATH):
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+    tmp = path + '.tmp'
+    with gzip.open(tmp, 'wt', encoding='utf-8') as fh:
+        json.dump(data, fh, separators=(',', ':'), ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def exists(path=SNAPSHOT_PATH):
+    return os.path.exists(path)
+
+
+def load(path=SNAPSHOT_PATH):
+    """Return the snapshot, reading it at most once per process.
+
+    Returns None if no usable snapshot file ships with the app; lookups then
+    go to the live page (see lookup.records).
+    """
+    global _snapshot
+    with _lock:
+        if _snapshot is None:
+            try:
+                _snapshot = read(path)
+            except (IOError, OSError, ValueError):
+                _snapshot = False
+        return _snapshot or None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the offline formula dictionary snapshot.')
+    parser.add_argument('--url', default=DICTIONARY_URL)
+    parser.add_argument('--output', default=SNAPSHOT_PATH)
+    parser.add_argument('--force', action='store_true', help='rebuild even if the page has not changed')
+    args = parser.parse_args(argv)
+    validators = None
+    if not args.force and exists(args.output):
+        try:
+            previous = read(args.output)
+        except (IOError, OSError, ValueError):
+            previous = {}
+        if previous.get('source') == args.url:
+            validators = previous.get('validators')
+    data = fetch(args.url, validators)
+    if data is None:
+        print('{} is up to date'.format(args.output))
+        return
+    write(data, args.output)
+    print('wrote {} ({} tables, {} rows, {} articles)'.format(
+        args.output, len(data['tables']), sum(len(r) for r in data['tables'].values()), len(data['articles'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Read-only SQLite copy of the dictionary, shared by all workers.
+
+Each worker used to build its own in-memory index from the snapshot, so
+memory and warm-up grew with the worker count. ``python store.py`` turns
+the snapshot into ``data/dictionary.sqlite`` with the rows and the formula ->
+article map, indexed by exact and Hill-order formula. Workers open it
+read-only and memory-mapped, so the data sits once in the OS page cache
+and a worker only holds a connection per thread.
+
+Article hrefs double as the keys of the on-disk article cache (see
+lookup.articles), so a row leads straight to its cached body.
+"""
+import argparse
+import os
+import sqlite3
+import threading
+
+import formula
+import index
+import snapshot
+
+STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'dictionary.sqlite')
+
+MMAP_BYTES = 64 * 1024 * 1024
+
+SCHEMA = '''
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE rows (
+    id INTEGER PRIMARY KEY,
+    formula TEXT NOT NULL,
+    key TEXT NOT NULL,
+    hill TEXT,
+    synonyms TEXT,
+    cas TEXT,
+    href TEXT,
+    tbl TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE INDEX rows_key ON rows (key);
+CREATE INDEX rows_hill ON rows (hill);
+CREATE TABLE articles (key TEXT PRIMARY KEY, href TEXT NOT NULL) WITHOUT ROWID;
+'''
+
+_lock = threading.Lock()
+_store = None
+
+
+def build(data, path=STORE_PATH):
+    """Write the snapshot ``data`` to a fresh store at ``path``."""
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+    tmp = path + '.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    db = sqlite3.connect(tmp)
+    try:
+        db.executescript(SCHEMA)
+        db.executemany('INSERT INTO meta VALUES (?, ?)', [
+            ('version', str(snapshot.SNAPSHOT_VERSION)),
+            ('source', data['source']),
+            ('created', data['created'])])
+        db.executemany(
+            'INSERT INTO rows (formula, key, hill, synonyms, cas, href, tbl, position) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            ((row[0], formula.normalize(row[0]), formula.hill_key(row[0]), row[1], row[2],
+              (row[3] if len(row) > 3 else None) or None, tid, position)
+             for tid in snapshot.table_ids()
+             for position, row in enumerate(data['tables'].get(tid, ()))))
+        db.executemany('INSERT INTO articles VALUES (?, ?)', sorted(data['articles'].items()))
+        db.commit()
+        db.execute('VACUUM')
+    finally:
+        db.close()
+    os.replace(tmp, path)
+
+
+class Store(object):
+    """Dictionary lookups against the SQLite store, same interface as index.FormulaIndex."""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        version = self._query('SELECT value FROM meta WHERE key = ?', ('version',))
+        if not version or version[0][0] != str(snapshot.SNAPSHOT_VERSION):
+            raise ValueError('store {} does not match snapshot version {}'.format(
+                path, snapshot.SNAPSHOT_VERSION))
+
+    def _connection(self):
+        # Connections must not cross a fork, so a worker forked from a
+        # preloaded master opens its own.
+        db = getattr(self._local, 'db', None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect('file:{}?mode=ro&immutable=1'.format(self.path), uri=True)
+            db.execute('PRAGMA mmap_size = {}'.format(MMAP_BYTES))
+            self._local.db = db
+            self._local.pid = os.getpid()
+        return db
+
+    def close(self):
+        """Close this thread's connection; the next query opens a new one."""
+        db = getattr(self._local, 'db', None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    def _query(self, sql, args):
+        return self._connection().execute(sql, args).fetchall()
+
+    def __len__(self):
+        return self._query('SELECT COUNT(DISTINCT key) FROM rows', ())[0][0]
+
+    def _records(self, column, key):
+        return tuple(index.Record(*row) for row in self._query(
+            'SELECT formula, synonyms, cas, href, tbl, position FROM rows WHERE {} = ? ORDER BY id'.format(column),
+            (key,)))
+
+    def lookup(self, text):
+        found = self._records('key', formula.normalize(text))
+        if found:
+            return found
+        key = formula.hill_key(text)
+        if key is None:
+            return ()
+        return self._records('hill', key)
+
+    def article(self, text):
+        for key in (formula.normalize(text), formula.hill_key(text)):
+            found = self._query('SELECT href FROM articles WHERE key = ?', (key,)) if key else None
+            if found:
+                return found[0][0]
+        return None
+
+
+def get():
+    """The shared store if one ships with the app, else the in-memory index.
+
+    None when there is neither a store nor a snapshot.
+    """
+    global _store
+    with _lock:
+        if _store is None:
+            try:
+                _store = Store()
+            except (sqlite3.Error, ValueError):
+                _store = False
+    return _store or index.get()
+
+
+def close():
+    """Close the shared store's connection in this thread, if it has one."""
+    with _lock:
+        if _store:
+            _store.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the shared SQLite store from the dictionary snapshot.')
+    parser.add_argument('--snapshot', default=snapshot.SNAPSHOT_PATH)
+    parser.add_argument('--output', default=STORE_PATH)
+    args = parser.parse_args(argv)
+    data = snapshot.read(args.snapshot)
+    build(data, args.output)
+    print('wrote {} ({} bytes)'.format(args.output, os.path.getsize(args.output)))
+
+
+if __name__ == '__main__':
+    main()
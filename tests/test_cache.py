@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import cache
+
+
+class Clock(object):
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_evicts_least_recently_used():
+    lru = cache.LRUCache('test', max_bytes=10, ttl=60, clock=Clock())
+    lru.put('a', 'A', 4)
+    lru.put('b', 'B', 4)
+    assert lru.get('a') == 'A'
+    lru.put('c', 'C', 4)
+    assert lru.get('b') is None
+    assert lru.get('a') == 'A' and lru.get('c') == 'C'
+    assert lru.nbytes == 8
+
+
+def test_lru_skips_oversized_values():
+    lru = cache.LRUCache('test', max_bytes=10, ttl=60, clock=Clock())
+    lru.put('a', 'A', 4)
+    lru.put('a', 'huge', 11)
+    assert lru.get('a') is None
+    assert lru.nbytes == 0
+
+
+def test_lru_expiry():
+    clock = Clock()
+    lru = cache.LRUCache('test', max_bytes=10, ttl=60, clock=clock)
+    lru.put('a', 'A', 1)
+    clock.now += 60
+    assert lru.get_stale('a') == ('A', True)
+    assert lru.get('a') is None
+    assert lru.get_stale('a') == (None, False)
+
+
+def test_disk_roundtrip(tmp_path):
+    disk = cache.DiskCache('test', str(tmp_path), max_bytes=1 << 20, ttl=60, clock=Clock())
+    assert disk.get('/wiki/Water') is None
+    disk.put('/wiki/Water', u'<p>Water – H₂O</p>', {'etag': '"1"'})
+    assert disk.get('/wiki/Water') == u'<p>Water – H₂O</p>'
+    assert disk.meta('/wiki/Water') == {'etag': '"1"'}
+    assert len(disk) == 1
+    # A second instance, as in another worker, sees the same entries.
+    assert cache.DiskCache('test', str(tmp_path), max_bytes=1 << 20).get('/wiki/Water') == u'<p>Water – H₂O</p>'
+
+
+def test_disk_expiry(tmp_path):
+    clock = Clock()
+    disk = cache.DiskCache('test', str(tmp_path), max_bytes=1 << 20, ttl=60, clock=clock)
+    disk.put('a', 'A')
+    assert disk.get_stale('a') == ('A', False)
+    clock.now += 60
+    assert disk.get_stale('a') == ('A', True)
+
+
+def test_disk_eviction(tmp_path):
+    disk = cache.DiskCache('test', str(tmp_path), max_bytes=1 << 20)
+    for n in range(3):
+        disk.put(str(n), str(n) * 1000)
+    size = disk.nbytes
+    small = cache.DiskCache('test', str(tmp_path), max_bytes=size)
+    small.put('3', '3' * 1000)
+    assert len(small) == 3
+    assert small.nbytes <= size
+    assert small.get('3') is not None
+
+
+def test_disk_clear(tmp_path):
+    disk = cache.DiskCache('test', str(tmp_path), max_bytes=1 << 20)
+    disk.put('a', 'A')
+    disk.clear()
+    assert disk.get('a') is None and len(disk) == 0
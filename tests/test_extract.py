@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import extract
+
+PAGE = b'''<html><body>
+<table id="skipped"><tr><td>XX</td><td>not wanted</td><td>0-00-0</td></tr></table>
+<table id="A">
+<tr><th>Formula</th><th>Synonyms</th><th>CAS number</th></tr>
+<tr><td><a href="./Water.html">H<sub>2</sub>O</a></td><td>water,  oxidane</td><td>7732-18-5</td></tr>
+<tr><td rowspan="2">C2H6O</td><td>ethanol</td><td>64-17-5</td></tr>
+<tr><td>dimethyl ether</td><td>115-10-6</td></tr>
+<tr><td>He</td></tr>
+</table>
+<table id="B"><tr><td>NaCl</td><td>salt</td><td>7647-14-5</td></tr></table>
+</body></html>'''
+
+
+def test_tables():
+    found = extract.tables(PAGE, ['A', 'B'])
+    assert found == {
+        'A': [
+            ('H2O', 'water, oxidane', '7732-18-5', './Water.html'),
+            ('C2H6O', 'ethanol', '64-17-5', ''),
+            ('C2H6O', 'dimethyl ether', '115-10-6', ''),
+            ('He', '', '', ''),
+        ],
+        'B': [('NaCl', 'salt', '7647-14-5', '')],
+    }
+
+
+def test_missing_table():
+    assert extract.tables(PAGE, ['B', 'missing']) == {'B': [('NaCl', 'salt', '7647-14-5', '')]}
+
+
+def test_blocks_split_anywhere():
+    blocks = [PAGE[i:i + 7] for i in range(0, len(PAGE), 7)]
+    assert extract.stream_tables(blocks, ['A', 'B']) == extract.tables(PAGE, ['A', 'B'])
+
+
+def test_text_input():
+    assert extract.tables(PAGE.decode('utf-8'), ['B']) == {'B': [('NaCl', 'salt', '7647-14-5', '')]}
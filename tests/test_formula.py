@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import elements
+import formula
+
+CHEMISTRY_JS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'chemistry.js')
+
+
+@pytest.mark.parametrize('text, counts', [
+    ('H2O', {'H': 2, 'O': 1}),
+    ('Al2(SO4)3', {'Al': 2, 'S': 3, 'O': 12}),
+    ('Al2Si2O5(OH)4', {'Al': 2, 'Si': 2, 'O': 9, 'H': 4}),
+    ('NH4Cl', {'N': 1, 'H': 4, 'Cl': 1}),
+    (' C H4 ', {'C': 1, 'H': 4}),
+])
+def test_parse(text, counts):
+    assert formula.parse(text) == counts
+
+
+@pytest.mark.parametrize('text', ['', 'H2O)', '(H2O', 'CuSO4·5H2O', 'h2o'])
+def test_parse_rejects(text):
+    with pytest.raises(ValueError):
+        formula.parse(text)
+
+
+@pytest.mark.parametrize('text, key', [
+    ('H2O', 'H2O'),
+    ('OH2', 'H2O'),
+    ('HCOOH', 'CH2O2'),
+    ('NaCl', 'ClNa'),
+    ('Ca(OH)2', 'CaH2O2'),
+    ('not a formula', None),
+])
+def test_hill_key(text, key):
+    assert formula.hill_key(text) == key
+
+
+def test_normalize():
+    assert formula.normalize(' Al2 (SO4)3\n') == 'Al2(SO4)3'
+
+
+def test_every_element_has_an_order():
+    assert formula.ALPHABETICAL == sorted(elements.SYMBOLS)
+    for order in formula.ORDERS.values():
+        assert sorted(order) == formula.ALPHABETICAL
+
+
+def test_rules_are_json():
+    rules = json.loads(json.dumps(formula.rules()))
+    assert rules['aliases'][formula.hill_key('Al(OH)3')] == 'Al(OH)3'
+    assert rules['aliases'][formula.hill_key('LiH')] == 'DLi'
+    assert ['SO4', {'S': 1, 'O': 4}, False] in rules['ions']
+
+
+# Selections and the formula the page builds for them from formula.rules().
+SELECTIONS = [
+    ({'C': 1, 'H': 4}, 'organic', 'CH4'),
+    ({'H': 2, 'O': 1}, 'organic', 'H2O'),
+    ({'O': 1, 'H': 2}, 'hydro', 'OH2'),
+    ({'Ca': 1, 'O': 2, 'H': 2}, 'hydro', 'Ca(OH)2'),
+    ({'Na': 1, 'Cl': 1}, 'ionic', 'NaCl'),
+    ({'N': 1, 'H': 4, 'Cl': 1}, 'ionic', 'NH4Cl'),
+    ({'Li': 1, 'H': 1}, 'ionic', 'DLi'),
+    ({'Fe': 2, 'O': 3}, 'oxide', 'Fe2O3'),
+    ({'Al': 2, 'S': 3, 'O': 12}, 'ionic', 'Al2(SO4)3'),
+    ({'Na': 0}, 'organic', ['']),
+]
+
+RUN_FORMULA = '''
+global.window = {};
+require(process.argv[1]);
+var input = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+var formula = window.dash_clientside.chemistry.formula;
+console.log(JSON.stringify(input.selections.map(function (s) {
+    return JSON.parse(formula(JSON.stringify(s[1]), s[0], input.rules));
+})));
+'''
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='needs node to run assets/chemistry.js')
+def test_browser_formulas():
+    data = json.dumps({'rules': formula.rules(), 'selections': [[s, c] for s, c, _ in SELECTIONS]})
+    done = subprocess.run(['node', '-e', RUN_FORMULA, CHEMISTRY_JS], input=data, stdout=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+    assert json.loads(done.stdout) == [expected for _, _, expected in SELECTIONS]
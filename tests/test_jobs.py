@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+
+import pytest
+
+import app
+import jobs
+import lookup
+
+
+@pytest.fixture(autouse=True)
+def empty(monkeypatch):
+    monkeypatch.setattr(jobs, '_jobs', type(jobs._jobs)())
+
+
+def test_start_runs_once_per_key():
+    release = threading.Event()
+    calls = []
+
+    def work(value):
+        calls.append(value)
+        release.wait(5)
+        return value * 2
+    assert jobs.start('a', work, 1) == 'a'
+    assert jobs.start('a', work, 2) == 'a'
+    release.set()
+    assert jobs.result('a').result(5) == 2
+    # Finished jobs are kept: starting it again returns the same result.
+    jobs.start('a', work, 3)
+    assert jobs.result('a').result(5) == 2
+    assert calls == [1]
+
+
+def test_forget():
+    jobs.start('a', lambda: 1)
+    jobs.result('a').result(5)
+    jobs.forget('a')
+    assert jobs.result('a') is None
+    jobs.start('a', lambda: 2)
+    assert jobs.result('a').result(5) == 2
+
+
+def test_failed_job():
+    def fail():
+        raise ValueError('boom')
+    jobs.start('a', fail)
+    with pytest.raises(ValueError):
+        jobs.result('a').result(5)
+
+
+def test_oldest_finished_jobs_dropped(monkeypatch):
+    monkeypatch.setattr(jobs, 'MAX_JOBS', 2)
+    release = threading.Event()
+    jobs.start('running', release.wait, 5)
+    for key in 'abc':
+        jobs.start(key, lambda: None)
+        jobs.result(key).result(5)
+    # The running job is never dropped, however old.
+    jobs.start('d', lambda: None)
+    release.set()
+    assert list(jobs._jobs) == ['running', 'd']
+
+
+def results(client, request, trigger):
+    body = {
+        'output': '..textbox-2.value...article.src...search-poll.disabled..',
+        'inputs': [{'id': 'search-request', 'property': 'data', 'value': request},
+                   {'id': 'search-poll', 'property': 'n_intervals', 'value': 1}],
+        'state': [],
+        'changedPropIds': [trigger]}
+    response = client.post('/_dash-update-component', data=json.dumps(body), content_type='application/json')
+    if response.status_code == 204:
+        return None
+    return json.loads(response.data)['response']
+
+
+def test_search_started_on_another_worker(monkeypatch):
+    searched = []
+
+    def search(chem):
+        searched.append(chem)
+        return [('H2O', 'water', '7732-18-5')], None
+    monkeypatch.setattr(lookup, 'search', search)
+    client = app.server.test_client()
+    request = {'formula': 'H2O', 'at': 0, 'job': 'H2O'}
+    # This worker never saw the job: the poll starts it here.
+    found = results(client, request, 'search-poll.n_intervals')
+    jobs.result('H2O').result(5)
+    if found is None:
+        found = results(client, request, 'search-poll.n_intervals')
+    assert 'water' in found['textbox-2']['value']
+    assert found['search-poll']['disabled'] is True
+    # A poll that arrives after the result was delivered does not search again.
+    assert results(client, request, 'search-poll.n_intervals') == found
+    assert searched == ['H2O']
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+
+import cache
+import index
+import lookup
+import metrics
+import upstream
+
+WATER = index.Record('H2O', 'water', '7732-18-5', '/wiki/Water', 'mwKA', 0)
+
+
+def test_search(monkeypatch):
+    monkeypatch.setattr(lookup, 'records', lambda chem: (WATER,))
+    monkeypatch.setattr(lookup, 'article', lambda chem: '<p>Water</p>')
+    assert lookup.search('H2O') == ([('H2O', 'water', '7732-18-5')], '<p>Water</p>')
+
+
+def test_search_unreachable(monkeypatch):
+    def fail(chem):
+        raise upstream.Unavailable('down')
+    monkeypatch.setattr(lookup, 'records', fail)
+    monkeypatch.setattr(lookup, 'article', fail)
+    assert lookup.search('H2O') == (None, None)
+
+
+def test_article_error_keeps_rows(monkeypatch):
+    def broken(chem):
+        raise RuntimeError('cannot render')
+    monkeypatch.setattr(lookup, 'records', lambda chem: (WATER,))
+    monkeypatch.setattr(lookup, 'article', broken)
+    assert lookup.search('H2O') == ([('H2O', 'water', '7732-18-5')], None)
+
+
+def test_cached_article_never_fetches(monkeypatch, tmp_path):
+    def fetch(*args):
+        raise AssertionError('fetched')
+    monkeypatch.setattr(lookup, 'articles', cache.DiskCache('test-articles', str(tmp_path), 1 << 20, 0))
+    monkeypatch.setattr(lookup, 'article_href', lambda chem, cached_only=False: '/wiki/Water')
+    monkeypatch.setattr(lookup, '_store_article', fetch)
+    monkeypatch.setattr(lookup, '_load_tables', fetch)
+    assert lookup.cached_article('H2O') is None
+    # Expired (the TTL is 0) but still served.
+    lookup.articles.put('/wiki/Water', '<p>Water</p>')
+    assert lookup.cached_article('H2O') == '<p>Water</p>'
+
+
+def concurrently(flight, fn, callers=8):
+    """Call ``flight.do('key', fn)`` from ``callers`` threads while ``fn`` is still running."""
+    release = threading.Event()
+    calls = []
+
+    def leader():
+        calls.append(1)
+        release.wait(5)
+        return fn()
+
+    coalesced = metrics.counters().get('lookup.coalesced', 0)
+    results = [None] * callers
+
+    def call(i):
+        try:
+            results[i] = ('ok', flight.do('key', leader))
+        except Exception as error:
+            results[i] = ('error', error)
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    # Let the leader go only once every other caller is waiting on it.
+    deadline = time.time() + 5
+    while metrics.counters().get('lookup.coalesced', 0) - coalesced < callers - 1:
+        assert time.time() < deadline
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return calls, results
+
+
+def test_single_flight_shares_result():
+    result = object()
+    calls, results = concurrently(lookup.SingleFlight(), lambda: result)
+    assert len(calls) == 1
+    assert results == [('ok', result)] * 8
+
+
+def test_single_flight_shares_exception():
+    error = upstream.Unavailable('down')
+
+    def fail():
+        raise error
+    flight = lookup.SingleFlight()
+    calls, results = concurrently(flight, fail)
+    assert len(calls) == 1
+    assert results == [('error', error)] * 8
+    # The key is free again for the next caller.
+    with pytest.raises(upstream.Unavailable):
+        flight.do('key', fail)
+    assert flight.do('key', lambda: 1) == 1
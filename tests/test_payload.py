@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import gzip
+
+import brotli
+import flask
+import pytest
+
+import payload
+
+BODY = b'{"layout": "' + b'element ' * 200 + b'"}'
+
+
+@pytest.fixture
+def app():
+    app = flask.Flask(__name__)
+    body = payload.Payload(BODY, 'application/json')
+
+    @app.route('/body')
+    def serve():
+        return body.response(immutable=payload.fingerprinted())
+
+    return app.test_client()
+
+
+@pytest.mark.parametrize('accept, encoding, decode', [
+    ('gzip, deflate, br', 'br', brotli.decompress),
+    ('gzip', 'gzip', gzip.decompress),
+    ('br;q=0, gzip', 'gzip', gzip.decompress),
+    ('', None, lambda data: data),
+])
+def test_encodings(app, accept, encoding, decode):
+    response = app.get('/body', headers={'Accept-Encoding': accept})
+    assert response.headers.get('Content-Encoding') == encoding
+    assert decode(response.get_data()) == BODY
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+
+def test_strong_etag_per_encoding(app):
+    plain = app.get('/body').headers['ETag']
+    compressed = app.get('/body', headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+    assert not plain.startswith('W/') and plain != compressed
+    response = app.get('/body', headers={'Accept-Encoding': 'gzip', 'If-None-Match': compressed})
+    assert response.status_code == 304 and response.get_data() == b''
+    assert app.get('/body', headers={'If-None-Match': compressed}).status_code == 200
+
+
+def test_immutable_only_when_fingerprinted(app):
+    assert app.get('/body').headers['Cache-Control'] == 'no-cache'
+    assert app.get('/body?v=').headers['Cache-Control'] == 'no-cache'
+    assert app.get('/body?v=1.0.0').headers['Cache-Control'] == payload.IMMUTABLE
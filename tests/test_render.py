@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import render
+
+PAGE = '''<html><head><script>alert(1)</script></head><body>
+{indicators}
+<div id="mw-content-text"><div class="mw-parser-output">
+<div class="hatnote">Not to be confused with heavy water.</div>
+{infobox}
+<p><b>Water</b> is an <a href="/wiki/Inorganic_compound" onclick="steal()">inorganic compound</a>.</p>
+<p><a href="javascript:alert(1)">It</a> is transparent.<sup class="reference">[1]</sup></p>
+<h2>History</h2>
+<p>Not part of the lead.</p>
+</div></div></body></html>'''
+
+INDICATORS = '<div class="mw-indicators"><div class="mw-parser-output"><p>Semi-protected</p></div></div>'
+
+INFOBOX = '<table class="infobox"><tr><td><img src="//upload.wikimedia.org/water.png"></td></tr></table>'
+
+
+def test_lead():
+    body = render.article(PAGE.format(indicators='', infobox=INFOBOX).encode('utf-8'))
+    assert 'inorganic compound' in body
+    assert 'transparent' in body
+    assert 'https://upload.wikimedia.org/water.png' in body
+    for dropped in ('Not part of the lead', 'heavy water', 'alert', 'steal', '[1]'):
+        assert dropped not in body
+
+
+def test_lead_after_indicators():
+    body = render.article(PAGE.format(indicators=INDICATORS, infobox=INFOBOX).encode('utf-8'))
+    assert 'Semi-protected' not in body
+    assert 'inorganic compound' in body
+
+
+def test_oversized_infobox_keeps_paragraphs():
+    infobox = '<table class="infobox">{}</table>'.format('<tr><td>{}</td></tr>'.format('x' * 1000) * 70)
+    body = render.article(PAGE.format(indicators='', infobox=infobox).encode('utf-8'))
+    assert 'x' * 1000 not in body
+    assert 'inorganic compound' in body
+    assert len(body.encode('utf-8')) < render.MAX_BYTES
+
+
+@pytest.mark.parametrize('page', [b'', b'   ', b'<html><body><p>No article here.</p></body></html>',
+                                  b'<html><body><div id="mw-content-text"><div class="mw-parser-output"><h2>Only a heading</h2>',
+                                  INDICATORS.encode('utf-8')])
+def test_no_article(page):
+    assert render.article(page) is None
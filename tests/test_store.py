@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import sqlite3
+
+import pytest
+
+import snapshot
+import store
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    tid = snapshot.table_ids()[0]
+    data = {
+        'source': 'test',
+        'created': '2019-01-01T00:00:00Z',
+        'tables': {tid: [['H2O', 'water', '7732-18-5', '/wiki/Water'], ['CH4', 'methane', '74-82-8']]},
+        'articles': {'H2O': '/wiki/Water'},
+    }
+    path = str(tmp_path / 'dictionary.sqlite')
+    store.build(data, path)
+    return store.Store(path)
+
+
+def test_lookup(dictionary):
+    found = dictionary.lookup('H2O')
+    assert [(r.formula, r.synonyms, r.cas, r.href) for r in found] == [('H2O', 'water', '7732-18-5', '/wiki/Water')]
+    assert dictionary.lookup(' H 2O') == found
+    assert dictionary.lookup('OH2') == found
+    assert dictionary.lookup('NaCl') == ()
+    assert len(dictionary) == 2
+
+
+def test_article(dictionary):
+    assert dictionary.article('H2O') == '/wiki/Water'
+    assert dictionary.article('OH2') == '/wiki/Water'
+    assert dictionary.article('CH4') is None
+
+
+def test_close_reopens(dictionary):
+    dictionary.close()
+    assert dictionary._local.db is None
+    assert dictionary.article('H2O') == '/wiki/Water'
+
+
+def test_missing_store(tmp_path):
+    with pytest.raises(sqlite3.Error):
+        store.Store(str(tmp_path / 'missing.sqlite'))
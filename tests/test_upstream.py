@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import http.server
+import threading
+
+import pytest
+
+import cache
+import lookup
+import metrics
+import upstream
+
+DICTIONARY = (b'<html><body><table id="mwKA">'
+              b'<tr><th>Formula</th><th>Synonyms</th><th>CAS</th></tr>'
+              b'<tr><td>AgBr</td><td>silver bromide</td><td>7785-23-1</td></tr>'
+              b'</table></body></html>')
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.startswith('/moved/'):
+            self.send_response(301)
+            self.send_header('Location', self.path[len('/moved'):])
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.path.startswith('/status/'):
+            self.send_response(int(self.path[len('/status/'):]))
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        etag = None
+        path = self.path
+        if path.startswith('/etag/'):
+            # /etag/<tag>/<path>: <path> with ETag "<tag>", 304 if the request has it.
+            tag, path = path[len('/etag/'):].split('/', 1)
+            etag = '"{}"'.format(tag)
+            path = '/' + path
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+        body = DICTIONARY if path == '/dictionary' else b'hello from ' + path.encode('ascii')
+        self.send_response(200)
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def breakers():
+    upstream._breakers.clear()
+    yield
+    upstream._breakers.clear()
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield 'http://127.0.0.1:{}'.format(httpd.server_address[1])
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_get(server):
+    assert upstream.get(server + '/page') == b'hello from /page'
+
+
+def test_get_follows_redirects(server):
+    assert upstream.get(server + '/moved/moved/page') == b'hello from /page'
+
+
+def test_too_many_redirects(server):
+    with pytest.raises(upstream.FetchError):
+        upstream.get(server + '/moved' * (upstream.MAX_REDIRECTS + 1) + '/page')
+
+
+def test_max_bytes(server):
+    with pytest.raises(upstream.FetchError):
+        upstream.get(server + '/page', max_bytes=4)
+
+
+def test_get_if_changed(server):
+    page, found = upstream.get_if_changed(server + '/etag/a/page')
+    assert page == b'hello from /page'
+    assert found['etag'] == '"a"'
+    assert found['sha256'] == hashlib.sha256(page).hexdigest()
+
+
+def test_get_if_changed_not_modified(server):
+    _, found = upstream.get_if_changed(server + '/etag/a/page')
+    calls = []
+    page, again = upstream.get_if_changed(server + '/etag/a/page', found, parse=calls.append)
+    assert page is None
+    assert again == found
+    assert calls == []
+
+
+def test_get_if_changed_same_content(server):
+    _, found = upstream.get_if_changed(server + '/etag/a/page')
+    # A new ETag, but the body hashes the same.
+    page, again = upstream.get_if_changed(server + '/etag/b/page', found)
+    assert page is None
+    assert again['etag'] == '"b"'
+    assert again['sha256'] == found['sha256']
+
+
+def test_get_if_changed_hashes_what_parse_leaves(server):
+    # parse reads nothing; the whole body is still hashed.
+    parsed, found = upstream.get_if_changed(server + '/etag/a/page', parse=lambda blocks: 'parsed')
+    assert parsed == 'parsed'
+    assert found['sha256'] == hashlib.sha256(b'hello from /page').hexdigest()
+
+
+@pytest.fixture
+def tables(monkeypatch):
+    monkeypatch.setattr(lookup, 'tables', cache.LRUCache('test-tables', 1 << 20, 60))
+    monkeypatch.setattr(lookup, '_table_validators', {})
+
+
+def test_load_tables(server, tables):
+    loaded = lookup._load_tables(server + '/etag/a/dictionary')
+    assert [r.synonyms for r in loaded['mwKA'].lookup('AgBr')] == ['silver bromide']
+    assert lookup._table_validators[server + '/etag/a/dictionary']['etag'] == '"a"'
+
+
+@pytest.mark.parametrize('etag', [None, '"old"'])
+def test_load_tables_unchanged(server, tables, etag):
+    # Sent with the page's own ETag it comes back 304; with an old one,
+    # the same content again.
+    url = server + '/etag/a/dictionary'
+    first = lookup._load_tables(url)
+    if etag:
+        lookup._table_validators[url] = dict(lookup._table_validators[url], etag=etag)
+    unchanged = metrics.counters().get('lookup.tables_unchanged', 0)
+    again = lookup._load_tables(url)
+    assert metrics.counters().get('lookup.tables_unchanged', 0) == unchanged + 1
+    assert again['mwKA'] is first['mwKA']
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_after_failures():
+    clock = Clock()
+    circuit = upstream.CircuitBreaker('example.org', failures=3, reset=10, clock=clock)
+    for _ in range(2):
+        circuit.failed()
+        assert circuit.allow()
+    circuit.failed()
+    assert circuit.state == circuit.OPEN
+    assert not circuit.allow()
+
+
+def test_breaker_success_resets_count():
+    circuit = upstream.CircuitBreaker('example.org', failures=2, reset=10, clock=Clock())
+    circuit.failed()
+    circuit.succeeded()
+    circuit.failed()
+    assert circuit.state == circuit.CLOSED
+
+
+def test_breaker_half_open_trial():
+    clock = Clock()
+    circuit = upstream.CircuitBreaker('example.org', failures=1, reset=10, clock=clock)
+    circuit.failed()
+    clock.now = 10
+    assert circuit.allow()
+    assert circuit.state == circuit.HALF_OPEN
+    # Only one trial request at a time.
+    assert not circuit.allow()
+    circuit.failed()
+    assert circuit.state == circuit.OPEN
+    clock.now = 20
+    assert circuit.allow()
+    circuit.succeeded()
+    assert circuit.state == circuit.CLOSED
+    assert circuit.allow()
+
+
+def test_missing_pages_do_not_open_the_breaker(server):
+    for _ in range(upstream.BREAKER_FAILURES + 1):
+        with pytest.raises(upstream.FetchError) as raised:
+            upstream.get(server + '/status/404')
+        assert not isinstance(raised.value, upstream.Unavailable)
+    assert upstream.breaker('127.0.0.1').state == upstream.CircuitBreaker.CLOSED
+    assert upstream.get(server + '/page') == b'hello from /page'
+
+
+def test_server_errors_open_the_breaker(server):
+    for _ in range(upstream.BREAKER_FAILURES):
+        with pytest.raises(upstream.Unavailable):
+            upstream.get(server + '/status/503')
+    with pytest.raises(upstream.CircuitOpen):
+        upstream.get(server + '/page')
+
+
+def test_connection_errors_are_unavailable(server):
+    with pytest.raises(upstream.Unavailable):
+        upstream.get('http://127.0.0.1:1/page')
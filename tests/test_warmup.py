@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import warmup
+
+
+def test_skip(monkeypatch):
+    monkeypatch.setattr(warmup, '_status', {'ready': False})
+    assert not warmup.status()['ready']
+    found = warmup.skip()
+    assert found['ready']
+    assert found['warmup'] == 'skipped'
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""Shared HTTP client for every upstream fetch (IPFS gateway, Wikipedia).
+
+Connections are pooled and kept alive per host, every request has connect
+and read timeouts, and bodies are read in blocks and cut off at
+``MAX_RESPONSE_BYTES``, so a slow or misbehaving upstream cannot pin a
+worker. Requests, errors and time spent are counted per host in metrics as
+``upstream.<host>.*``. Refreshes send the ETag / Last-Modified of the copy
+they already have, so an unchanged page costs a 304 and no body.
+
+Each host also has a circuit breaker: after ``BREAKER_FAILURES`` failures
+in a row (connection errors, timeouts and 5xx, not 4xx) it opens and requests to that host fail straight away for
+``BREAKER_RESET`` seconds, then a single trial request decides whether it
+closes again. The state is reported as the ``upstream.<host>.breaker`` gauge.
+"""
+import contextlib
+import hashlib
+import os
+import threading
+import time
+
+import certifi
+import urllib3
+
+import metrics
+
+CONNECT_TIMEOUT = float(os.environ.get('UPSTREAM_CONNECT_TIMEOUT', 3.05))
+READ_TIMEOUT = float(os.environ.get('UPSTREAM_READ_TIMEOUT', 10))
+MAX_RESPONSE_BYTES = int(os.environ.get('UPSTREAM_MAX_BYTES', 8 * 1024 * 1024))
+POOL_SIZE = int(os.environ.get('UPSTREAM_POOL_SIZE', 4))
+BREAKER_FAILURES = int(os.environ.get('UPSTREAM_BREAKER_FAILURES', 5))
+BREAKER_RESET = float(os.environ.get('UPSTREAM_BREAKER_RESET', 30))
+
+CHUNK_SIZE = 64 * 1024
+
+MAX_REDIRECTS = 3
+
+USER_AGENT = 'modular-chemistry (+https://github.com/robotwax/modular-chemistry)'
+
+pool = urllib3.PoolManager(
+    maxsize=POOL_SIZE,
+    timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=READ_TIMEOUT),
+    # No retries, but redirects are followed as urlopen did.
+    retries=urllib3.Retry(total=None, connect=0, read=0, redirect=MAX_REDIRECTS),
+    headers={'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'},
+    cert_reqs='CERT_REQUIRED',
+    ca_certs=certifi.where())
+
+
+class FetchError(IOError):
+    """An upstream request failed, timed out or sent too much."""
+
+
+class Unavailable(FetchError):
+    """The host could not be reached, timed out or answered with a 5xx.
+
+    Only these count against the host's circuit breaker; a 404 for one
+    missing page says nothing about the host.
+    """
+
+
+class CircuitOpen(FetchError):
+    """The host failed too often recently and is not being asked for now."""
+
+
+def _count(host, event, amount=1):
+    metrics.incr('upstream.{}.{}'.format(host, event), amount)
+
+
+class CircuitBreaker(object):
+    """Closed, open or half-open state of one upstream host."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, host, failures=BREAKER_FAILURES, reset=BREAKER_RESET, clock=time.monotonic):
+        self.host = host
+        self.failures = failures
+        self.reset = reset
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failed = 0
+        self._opened = None
+        self._report(self.CLOSED)
+
+    def _report(self, state):
+        self.state = state
+        metrics.gauge('upstream.{}.breaker'.format(self.host), state)
+
+    def allow(self):
+        """Whether a request may go out now; counts the ones that may not."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = self._clock()
+            if now - self._opened >= self.reset:
+                # One trial request; another one after ``reset`` seconds if
+                # it never reports back.
+                self._opened = now
+                self._report(self.HALF_OPEN)
+                return True
+        _count(self.host, 'short_circuited')
+        return False
+
+    def succeeded(self):
+        with self._lock:
+            self._failed = 0
+            if self.state != self.CLOSED:
+                self._report(self.CLOSED)
+
+    def failed(self):
+        with self._lock:
+            self._failed += 1
+            if self.state == self.HALF_OPEN or self._failed >= self.failures:
+                _count(self.host, 'breaker_trips')
+                self._opened = self._clock()
+                self._report(self.OPEN)
+
+
+_breakers_lock = threading.Lock()
+_breakers = {}
+
+
+def breaker(host):
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]
+
+
+def conditional_headers(validators):
+    """If-None-Match / If-Modified-Since headers for stored ``validators``."""
+    headers = {}
+    if validators and validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators and validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+
+class Body(object):
+    """Iterable over the blocks of a response body.
+
+    ``not_modified`` is set for a 304 answer to a conditional request, whose
+    body is empty; ``validators`` are the ETag and Last-Modified to send next
+    time.
+    """
+
+    def __init__(self, response, url, host, size, max_bytes):
+        self.url = url
+        self.not_modified = response.status == 304
+        self.validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        self._response = response
+        self._host = host
+        self._size = size
+        self._max_bytes = max_bytes
+
+    def __iter__(self):
+        total = 0
+        try:
+            for block in self._response.stream(self._size, decode_content=True):
+                total += len(block)
+                if total > self._max_bytes:
+                    raise FetchError('{}: response larger than {} bytes'.format(self.url, self._max_bytes))
+                yield block
+        except urllib3.exceptions.HTTPError as error:
+            raise Unavailable('{}: {}'.format(self.url, error))
+        finally:
+            _count(self._host, 'bytes', total)
+
+
+@contextlib.contextmanager
+def stream(url, size=CHUNK_SIZE, max_bytes=MAX_RESPONSE_BYTES, validators=None):
+    """Iterate over the body of ``url`` in blocks of about ``size`` bytes.
+
+    Yields a Body. With ``validators`` from an earlier response the request
+    is conditional, and an unchanged resource comes back as a Body with
+    ``not_modified`` set and nothing to read.
+
+    Raises Unavailable for connection errors, timeouts and 5xx responses,
+    which count against the host's circuit breaker, and FetchError for
+    other non-2xx responses and bodies larger than ``max_bytes``. The connection goes back
+    to the pool when the block exits, even if the body was not read to the
+    end.
+    """
+    host = urllib3.util.parse_url(url).host or 'unknown'
+    circuit = breaker(host)
+    if not circuit.allow():
+        raise CircuitOpen('{}: too many recent failures, not retrying yet'.format(host))
+    started = time.monotonic()
+    _count(host, 'requests')
+    response = None
+    try:
+        try:
+            response = pool.request(
+                'GET', url, headers=dict(pool.headers, **conditional_headers(validators)),
+                preload_content=False)
+        except urllib3.exceptions.MaxRetryError as error:
+            if isinstance(error.reason, urllib3.exceptions.ResponseError):
+                # Too many redirects: the host answered.
+                raise FetchError('{}: {}'.format(url, error.reason))
+            raise Unavailable('{}: {}'.format(url, error.reason))
+        except urllib3.exceptions.HTTPError as error:
+            raise Unavailable('{}: {}'.format(url, error))
+        if response.status == 304 and validators:
+            _count(host, 'not_modified')
+        elif response.status >= 500:
+            raise Unavailable('{}: HTTP {}'.format(url, response.status))
+        elif not 200 <= response.status < 300:
+            raise FetchError('{}: HTTP {}'.format(url, response.status))
+        yield Body(response, url, host, size, max_bytes)
+        circuit.succeeded()
+    except FetchError as error:
+        _count(host, 'errors')
+        if isinstance(error, Unavailable):
+            circuit.failed()
+        else:
+            circuit.succeeded()
+        raise
+    finally:
+        if response is not None:
+            # A body left half read cannot be reused; drop that connection.
+            if not response.closed:
+                response.close()
+            response.release_conn()
+        _count(host, 'ms', int((time.monotonic() - started) * 1000))
+
+
+def get(url, max_bytes=MAX_RESPONSE_BYTES):
+    """The whole body of ``url`` as bytes."""
+    with stream(url, max_bytes=max_bytes) as blocks:
+        return b''.join(blocks)
+
+
+def _hashed(blocks, digest):
+    for block in blocks:
+        digest.update(block)
+        yield block
+
+
+def get_if_changed(url, validators=None, max_bytes=MAX_RESPONSE_BYTES, parse=b''.join):
+    """``(parse(blocks), validators)`` for ``url``, None instead if it has not changed.
+
+    ``validators`` are those returned for an earlier copy. The resource
+    counts as unchanged on a 304, or when the body hashes to the same
+    sha256 as that copy did. ``parse`` gets the blocks of the body as they
+    arrive and is hashed along with them, so the page is never held whole
+    unless ``parse`` does so; what it leaves unread is read for the hash.
+    """
+    with stream(url, max_bytes=max_bytes, validators=validators) as body:
+        if body.not_modified:
+            return None, validators
+        digest = hashlib.sha256()
+        blocks = _hashed(body, digest)
+        parsed = parse(blocks)
+        for _ in blocks:
+            pass
+    found = dict(body.validators, sha256=digest.hexdigest())
+    if validators and validators.get('sha256') == found['sha256']:
+        _count(urllib3.util.parse_url(url).host or 'unknown', 'unchanged')
+        return None, found
+    return parsed, found
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Warm-up run once per app import, before gunicorn forks its workers.
+
+With ``preload_app`` (see gunicorn.conf.py) the app is imported in the
+gunicorn master, so everything loaded here - the dictionary store or index,
+Dash's first-request setup, the serialized layout and dependencies, the
+compressed script bundles - is shared copy-on-write by every worker, and a
+new or recycled worker serves its first Search hot. The objects are then frozen out of the cyclic garbage
+collector so collections in the workers do not dirty those shared pages.
+
+Nothing here leaves a socket, thread or database connection open to be
+carried over the fork: the SQLite store's connection, opened to check the
+store, is closed again, and workers open their own.
+"""
+import gc
+import os
+import re
+import threading
+import time
+
+import metrics
+import store
+
+_lock = threading.Lock()
+_status = {'ready': False}
+
+# Pages fetched through the test client to run Dash's lazy setup.
+PATHS = ('/', '/_dash-layout', '/_dash-dependencies')
+
+# Script bundles linked from the index page, compressed once here rather
+# than by every worker (see app.Dash.serve_component_suites).
+SUITE = re.compile(r'src="(/_dash-component-suites/[^"]+)"')
+
+
+def run(app):
+    """Warm ``app`` up; safe to call more than once."""
+    with _lock:
+        if _status['ready']:
+            return status()
+        started = time.monotonic()
+        dictionary = store.get()
+        client = app.server.test_client()
+        index = client.get('/').get_data(as_text=True)
+        suites = [path.replace('&amp;', '&') for path in SUITE.findall(index)]
+        for path in PATHS + tuple(suites):
+            response = client.get(path)
+            if response.status_code != 200:
+                raise RuntimeError('warm-up request to {} returned {}'.format(path, response.status_code))
+        store.close()
+        gc.collect()
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
+        _status.update(
+            ready=True,
+            pid=os.getpid(),
+            dictionary=type(dictionary).__name__ if dictionary is not None else None,
+            suites=len(suites),
+            seconds=round(time.monotonic() - started, 3))
+        metrics.gauge('warmup.seconds', _status['seconds'])
+        return status()
+
+
+def skip():
+    """Report ready without warming up, for ``WARMUP=0``: workers load lazily."""
+    with _lock:
+        _status.update(ready=True, warmup='skipped')
+        return status()
+
+
+def status():
+    """Whether warm-up has finished, where it ran and what it loaded."""
+    return dict(_status, worker=os.getpid())